@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Times the construction of some common mobjects and animations,
+with the merged CONFIG of each class cached, as it is normally,
+and with that cache emptied before every construction, which is
+how digest_config used to behave.  Also shows how many attributes
+each object holds in its own __dict__, which is fewer for classes
+keeping their CONFIG as class defaults, like TexSymbol.
+
+    python benchmarks/construction.py [number]
+"""
+import sys
+import timeit
+
+from manimlib import *
+from manimlib.utils.config_ops import CLASS_CONFIG_CACHE
+
+GLYPH_PATH = "M 0 0 L 1 0 C 2 0 2 1 1 1 L 0 1 Z"
+
+CASES = [
+    ("Square()", lambda: Square()),
+    ("TexSymbol", lambda: TexSymbol(GLYPH_PATH)),
+    ("Transform", lambda: Transform(Square(), Circle())),
+]
+
+
+def time_case(func, number, clear_cache):
+    def run():
+        if clear_cache:
+            CLASS_CONFIG_CACHE.clear()
+        func()
+    run()
+    return min(timeit.repeat(run, number=number, repeat=5)) / number
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print("{:<12}{:>16}{:>16}{:>10}{:>8}".format(
+        "", "uncached (us)", "cached (us)", "speedup", "attrs"
+    ))
+    for name, func in CASES:
+        before = time_case(func, number, clear_cache=True)
+        after = time_case(func, number, clear_cache=False)
+        print("{:<12}{:>16.1f}{:>16.1f}{:>9.2f}x{:>8}".format(
+            name, 1e6 * before, 1e6 * after, before / after,
+            len(func().__dict__),
+        ))
+
+
+if __name__ == "__main__":
+    main()
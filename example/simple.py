@@ -93,18 +93,6 @@ class Moving(MovingCameraScene):
         self.wait()
 
 
-class Mesh(VMobject):
-    """ Make a 2D triangular mesh """
-
-    def __init__(self, points, cells, **kwargs):
-        Mobject.__init__(self, **kwargs)
-
-        for row in cells:
-            vertices = [points[j] for j in row]
-            tri = self.start_new_path(vertices[2])
-            self.add_points_as_corners(vertices)
-
-
 class SimpleTitle(Scene):
 
     def construct(self):
@@ -161,21 +149,23 @@ class Help(ThreeDScene):
 
     def construct(self):
 
-        import meshio
-        mesh = meshio.read('square.msh')
-
-        bm = Mesh(mesh.points, mesh.cells['triangle'], color=RED,
-                  fill_color=BLUE, fill_opacity=0.85)
+        # square.msh is square.geo already meshed, so that
+        # gmsh isn't needed to run this
+        bm = TriangleMeshFromFile('square.msh',
+                                  fill_color=BLUE, fill_opacity=0.85,
+                                  stroke_color=RED, stroke_width=1)
+        verts = bm.get_triangles()[10]
         bm.shift([0,0,0.2])
 
-        verts = [mesh.points[j] for j in mesh.cells['triangle'][10]]
         q = Polygon(*verts, color=GREEN, fill_color=YELLOW, fill_opacity=1.0)
         q.shift([0,0,0.2])
         q.generate_target()
         q.target.scale(1.5)
         q.target.shift([0,0,.5])
 
-        self.play(Write(bm), Write(q))
+        # A TriangleMesh isn't a VMobject, which Write needs in order
+        # to draw its outline, so its cells are shown one by one instead
+        self.play(ShowCreation(bm), Write(q))
         self.wait()
 
         self.move_camera(
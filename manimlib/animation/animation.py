@@ -100,7 +100,29 @@ class Animation(object):
         ))
 
     def copy(self):
-        return deepcopy(self)
+        """
+        The mobjects held by self, however deeply, are copied with
+        Mobject.copy_into, which is much faster than deepcopying
+        them, and deepcopy then reuses those copies
+        """
+        memo = dict()
+        self.copy_mobjects_into(memo, set())
+        Mobject.relink_copies(memo)
+        return deepcopy(self, memo)
+
+    def copy_mobjects_into(self, memo, seen):
+        to_visit = list(self.__dict__.values())
+        while to_visit:
+            value = to_visit.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, Mobject):
+                value.copy_into(memo)
+            elif isinstance(value, (list, tuple)):
+                to_visit.extend(value)
+            elif isinstance(value, Animation):
+                to_visit.extend(value.__dict__.values())
 
     def update_config(self, **kwargs):
         digest_config(self, kwargs)
@@ -3,6 +3,7 @@ import itertools as it
 import operator as op
 import time
 import copy
+import weakref
 
 from PIL import Image
 from scipy.spatial.distance import pdist
@@ -12,6 +13,7 @@ import numpy as np
 from manimlib.constants import *
 from manimlib.mobject.types.image_mobject import AbstractImageMobject
 from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.mesh_mobject import TriangleMesh
 from manimlib.mobject.types.point_cloud_mobject import PMobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_int_rgba
@@ -23,6 +25,34 @@ from manimlib.utils.iterables import remove_list_redundancies
 from manimlib.utils.simple_functions import fdiv
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
+from manimlib.utils.spatial_index import SpatialIndex
+
+
+def render_stamps_match(stamp1, stamp2):
+    """
+    Render stamps are compared by the identity of their entries,
+    which is never wrong to call a mismatch
+    """
+    return (
+        stamp1 is not None and stamp2 is not None and
+        len(stamp1) == len(stamp2) and
+        all(map(op.is_, stamp1, stamp2))
+    )
+
+
+# The (x0, y0, x1, y1) pixel bounds of a rectangle with nothing in it
+EMPTY_PIXEL_RECT = (0, 0, 0, 0)
+
+
+def get_pixel_rect_union(rect1, rect2):
+    if rect1 == EMPTY_PIXEL_RECT:
+        return rect2
+    if rect2 == EMPTY_PIXEL_RECT:
+        return rect1
+    return (
+        min(rect1[0], rect2[0]), min(rect1[1], rect2[1]),
+        max(rect1[2], rect2[2]), max(rect1[3], rect2[3]),
+    )
 
 
 class Camera(object):
@@ -48,12 +78,51 @@ class Camera(object):
         # round z coordinate to nearest hundredth when comparring
         "z_buff_func": lambda m: np.round(m.get_center()[2], 2),
         "cairo_line_width_multiple": 0.01,
+        # Whether to keep images of runs of mobjects drawn straight
+        # onto the background, so that they needn't be drawn again
+        # while they stay unchanged, and how many to keep
+        "use_static_layers": True,
+        "max_static_layers": 4,
+        # Whether to keep track of which pixels have been drawn on
+        # since the pixel array was last set, so that setting it
+        # to the same array again only restores those, and drawing
+        # mobjects is clipped to the pixels they cover
+        "use_dirty_rects": True,
+        # Whether to keep the cairo path of each vectorized mobject
+        # drawn, to be appended as a whole while its points stay the
+        # same, rather than built again one curve at a time
+        "cache_cairo_paths": True,
+        # Whether to leave out families of mobjects lying wholly
+        # outside the frame, by as far as their strokes reach, plus
+        # culling_margin pixels for antialiasing
+        "cull_offscreen_mobjects": True,
+        "culling_margin": 2,
+        # From how many family members with points on culling looks
+        # them up in spatial_index, rather than going down through
+        # their families
+        "spatial_index_threshold": 1000,
     }
 
     def __init__(self, background=None, **kwargs):
         digest_config(self, kwargs, locals())
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        self.reset_static_layers()
+        # Pairs of the points version and scale a vmobject's cairo
+        # path was built at, and that path, by vmobject
+        self.cairo_path_cache = weakref.WeakKeyDictionary()
+        # The array the pixel array was last set to, and the pixels
+        # which may have been drawn on since, or None if unknown
+        self.pixel_array_source = None
+        self.dirty_rect = None
+        self.clip_rect = None
+        # How many family members with points were left out for
+        # being off screen, and how many were drawn, since the
+        # pixel array was last set, see get_frame_stats
+        self.num_culled_mobjects = 0
+        self.num_drawn_mobjects = 0
+        # Boxes around the points of mobjects drawn, by where they are
+        self.spatial_index = SpatialIndex()
         self.init_background()
         self.resize_frame_shape()
         self.reset()
@@ -63,7 +132,10 @@ class Camera(object):
         # will result in a segfault, which is somehow related
         # to the aggdraw library
         self.canvas = None
-        return copy.copy(self)
+        result = copy.copy(self)
+        result.reset_static_layers()
+        result.dirty_rect = None
+        return result
 
     def reset_pixel_shape(self, new_height, new_width):
         self.pixel_width = new_width
@@ -146,6 +218,22 @@ class Camera(object):
     def get_pixel_array(self):
         return self.pixel_array
 
+    def get_state_for_hashing(self):
+        # Pixel buffers and cairo contexts are filled in while
+        # drawing, so they say nothing about what will be drawn
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in [
+                "pixel_array", "pixel_array_to_cairo_context", "canvas",
+                "pixel_array_is_background", "static_layers",
+                "static_layer_frame_state", "static_layer_candidates",
+                "pixel_array_source", "dirty_rect", "clip_rect",
+                "cairo_path_cache", "num_culled_mobjects",
+                "num_drawn_mobjects", "spatial_index",
+            ]
+        }
+
     def convert_pixel_array(self, pixel_array, convert_from_floats=False):
         retval = np.array(pixel_array)
         if convert_from_floats:
@@ -157,6 +245,16 @@ class Camera(object):
         return retval
 
     def set_pixel_array(self, pixel_array, convert_from_floats=False):
+        self.pixel_array_is_background = False
+        self.num_culled_mobjects = 0
+        self.num_drawn_mobjects = 0
+        if self.can_restore_dirty_rect(pixel_array, convert_from_floats):
+            # Only the pixels drawn on since pixel_array was last
+            # set can differ from it
+            x0, y0, x1, y1 = self.dirty_rect
+            self.pixel_array[y0:y1, x0:x1] = pixel_array[y0:y1, x0:x1]
+            self.dirty_rect = EMPTY_PIXEL_RECT
+            return
         converted_array = self.convert_pixel_array(
             pixel_array, convert_from_floats)
         if not (hasattr(self, "pixel_array") and self.pixel_array.shape == converted_array.shape):
@@ -164,6 +262,21 @@ class Camera(object):
         else:
             # Set in place
             self.pixel_array[:, :, :] = converted_array[:, :, :]
+        if convert_from_floats:
+            self.pixel_array_source = None
+            self.dirty_rect = None
+        else:
+            self.pixel_array_source = pixel_array
+            self.dirty_rect = EMPTY_PIXEL_RECT
+
+    def can_restore_dirty_rect(self, pixel_array, convert_from_floats=False):
+        return (
+            self.use_dirty_rects and
+            not convert_from_floats and
+            self.dirty_rect is not None and
+            pixel_array is self.pixel_array_source and
+            pixel_array.shape == self.pixel_array.shape
+        )
 
     def set_background(self, pixel_array, convert_from_floats=False):
         self.background = self.convert_pixel_array(
@@ -194,8 +307,40 @@ class Camera(object):
 
     def reset(self):
         self.set_pixel_array(self.background)
+        # Until something is drawn on it, the pixel array may
+        # be replaced by a static layer
+        self.pixel_array_is_background = True
         return self
 
+    def get_frame_stats(self):
+        """
+        Returns how many family members with points were culled
+        and how many drawn since the pixel array was last set,
+        which for scenes is once a frame
+        """
+        return {
+            "culled": self.num_culled_mobjects,
+            "drawn": self.num_drawn_mobjects,
+        }
+
+    def reset_static_layers(self):
+        # Pairs of the render stamps of a run of mobjects and the
+        # image of that run drawn over the layer before it
+        self.static_layers = []
+        self.static_layer_frame_state = None
+        # Render stamps from the last time mobjects were
+        # drawn onto the background, by id
+        self.static_layer_candidates = dict()
+        return self
+
+    def get_static_layer_frame_state(self):
+        return (
+            self.background,
+            tuple(self.get_frame_center()),
+            self.get_frame_width(),
+            self.get_frame_height(),
+        )
+
     ####
 
     # TODO, it's weird that this is part of camera.
@@ -215,6 +360,7 @@ class Camera(object):
             self, mobjects,
             include_submobjects=True,
             excluded_mobjects=None):
+        top_level_mobjects = mobjects
         if include_submobjects:
             mobjects = self.extract_mobject_family_members(
                 mobjects, only_those_with_points=True,
@@ -224,31 +370,277 @@ class Camera(object):
                     excluded_mobjects
                 )
                 mobjects = list_difference_update(mobjects, all_excluded)
+        if self.cull_offscreen_mobjects:
+            num_mobjects = len(mobjects)
+            mobjects = self.cull_mobjects(mobjects, top_level_mobjects)
+            self.num_culled_mobjects += num_mobjects - len(mobjects)
         return mobjects
 
-    def is_in_frame(self, mobject):
+    def cull_mobjects(self, mobjects, top_level_mobjects):
+        """
+        Returns those of mobjects, all members of the families of
+        top_level_mobjects, which are in frame.  Long lists are looked
+        up in spatial_index, and others checked by going down through
+        the families of top_level_mobjects.
+        """
+        if len(mobjects) >= self.spatial_index_threshold:
+            # The index only holds boxes around points, so the frame
+            # is widened by as far as any of the strokes reach
+            x_low, x_high, y_low, y_high = self.get_frame_bounds(
+                max(self.get_stroke_reaches(mobjects), default=0)
+            )
+            onscreen_ids = self.spatial_index.update(mobjects).query_region(
+                (x_low, y_low, x_high, y_high)
+            )
+            return [mob for mob in mobjects if id(mob) in onscreen_ids]
+        offscreen_ids = self.get_offscreen_family_member_ids(
+            top_level_mobjects
+        )
+        return [mob for mob in mobjects if id(mob) not in offscreen_ids]
+
+    def get_offscreen_family_member_ids(self, mobjects):
+        """
+        Returns the ids of all members of the families of mobjects
+        which are not in frame.  Once a mobject is found not to be,
+        its whole family is ruled out without looking any further.
+        """
+        frame_bounds = self.get_frame_bounds()
+        reaches = self.get_family_stroke_reaches(mobjects)
+        offscreen_ids = set()
+        checked_ids = set()
+        to_check = list(mobjects)
+        while to_check:
+            mob = to_check.pop()
+            if id(mob) in checked_ids:
+                continue
+            checked_ids.add(id(mob))
+            if self.is_in_frame(mob, frame_bounds, reaches[id(mob)]):
+                to_check.extend(mob.submobjects)
+            else:
+                offscreen_ids.update(map(id, mob.get_family()))
+        return offscreen_ids
+
+    def get_frame_bounds(self, reach=0):
+        """
+        Returns the least and greatest x and y values within
+        culling_margin pixels, plus reach, of the frame
+        """
         fc = self.get_frame_center()
-        fh = self.get_frame_height()
         fw = self.get_frame_width()
-        return not reduce(op.or_, [
-            mobject.get_right()[0] < fc[0] - fw,
-            mobject.get_bottom()[1] > fc[1] + fh,
-            mobject.get_left()[0] > fc[0] + fw,
-            mobject.get_top()[1] < fc[1] - fh,
-        ])
+        fh = self.get_frame_height()
+        x_reach = fw / 2 + self.culling_margin * fw / self.get_pixel_width()
+        y_reach = fh / 2 + self.culling_margin * fh / self.get_pixel_height()
+        x_reach += reach
+        y_reach += reach
+        return (
+            fc[0] - x_reach, fc[0] + x_reach,
+            fc[1] - y_reach, fc[1] + y_reach,
+        )
+
+    def is_in_frame(self, mobject, frame_bounds=None, reach=None):
+        """
+        Returns whether anything drawn for the family of mobject
+        could come within culling_margin pixels of the frame, where
+        reach is how far its strokes reach past its points
+        """
+        if frame_bounds is None:
+            frame_bounds = self.get_frame_bounds()
+        if reach is None:
+            reach = self.get_family_stroke_reaches([mobject])[id(mobject)]
+        bounding_box = mobject.get_display_bounding_box()
+        if bounding_box is None:
+            return False
+        (x_min, y_min), (x_max, y_max) = bounding_box[:, :2]
+        x_low, x_high, y_low, y_high = frame_bounds
+        x_low -= reach
+        y_low -= reach
+        x_high += reach
+        y_high += reach
+        # Written so that nan coordinates count as in frame
+        return not (
+            x_max < x_low or x_min > x_high or
+            y_max < y_low or y_min > y_high
+        )
 
     def capture_mobject(self, mobject, **kwargs):
         return self.capture_mobjects([mobject], **kwargs)
 
     def capture_mobjects(self, mobjects, **kwargs):
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        self.num_drawn_mobjects += len(mobjects)
+        if self.use_static_layers and self.pixel_array_is_background:
+            mobjects = self.display_static_layers(mobjects)
+            # Any pixel may have come from a static layer
+            self.dirty_rect = None
+        self.pixel_array_is_background = False
+        if self.use_dirty_rects and self.dirty_rect is not None:
+            self.clip_rect = self.get_pixel_rect(mobjects)
+        if self.clip_rect is None:
+            self.dirty_rect = None
+        else:
+            self.dirty_rect = get_pixel_rect_union(
+                self.dirty_rect, self.clip_rect
+            )
+        try:
+            self.display_mobjects(mobjects)
+        finally:
+            self.clip_rect = None
+
+    def get_pixel_rect(self, mobjects):
+        """
+        Returns the (x0, y0, x1, y1) bounds of the pixels which
+        drawing mobjects could touch, or None if that can't be told,
+        which is whenever anything other than plain vectorized
+        mobjects is involved.
+        """
+        for mob in mobjects:
+            if not isinstance(mob, VMobject) or mob.get_background_image_file():
+                return None
+        mins = []
+        maxs = []
+        for mob, reach in zip(mobjects, self.get_stroke_reaches(mobjects)):
+            points = self.transform_points_pre_display(mob, mob.points)
+            if len(points) == 0:
+                continue
+            mins.append(np.min(points[:, :2], axis=0) - reach)
+            maxs.append(np.max(points[:, :2], axis=0) + reach)
+        if len(mins) == 0:
+            return EMPTY_PIXEL_RECT
 
+        pw = self.get_pixel_width()
+        ph = self.get_pixel_height()
+        fc = self.get_frame_center()
+        x_scale = pw / self.get_frame_width()
+        y_scale = ph / self.get_frame_height()
+        x_min, y_min = np.min(mins, axis=0)
+        x_max, y_max = np.max(maxs, axis=0)
+        # With a margin of a couple of pixels for antialiasing
+        bounds = np.array([
+            (x_min - fc[0]) * x_scale + pw / 2 - 2,
+            (fc[1] - y_max) * y_scale + ph / 2 - 2,
+            (x_max - fc[0]) * x_scale + pw / 2 + 2,
+            (fc[1] - y_min) * y_scale + ph / 2 + 2,
+        ])
+        if np.any(np.isnan(bounds)):
+            return None
+        x0, x1 = np.clip(bounds[0::2], 0, pw)
+        y0, y1 = np.clip(bounds[1::2], 0, ph)
+        if x0 >= x1 or y0 >= y1:
+            return EMPTY_PIXEL_RECT
+        return (
+            int(np.floor(x0)), int(np.floor(y0)),
+            int(np.ceil(x1)), int(np.ceil(y1)),
+        )
+
+    def get_stroke_reaches(self, mobjects):
+        """
+        Returns how far, in frame units, what is drawn for each
+        of mobjects alone can reach past its points
+        """
+        frame_width = self.get_frame_width()
+        # Strokes reach out by half their width, and by up to ten
+        # times that at sharp corners, cairo's default miter limit
+        stroke_multiple = 5 * self.cairo_line_width_multiple * (
+            frame_width / FRAME_WIDTH
+        )
+        pixel_size = frame_width / self.get_pixel_width()
+        reaches = []
+        for mob in mobjects:
+            if isinstance(mob, VMobject):
+                reach = stroke_multiple * max(
+                    mob.get_stroke_width(),
+                    mob.get_stroke_width(background=True),
+                )
+            elif isinstance(mob, TriangleMesh):
+                reach = stroke_multiple * mob.get_stroke_width()
+            elif isinstance(mob, PMobject):
+                # Points are drawn as squares this many pixels wide
+                reach = pixel_size * self.adjusted_thickness(mob.stroke_width)
+            else:
+                reach = 0
+            reaches.append(reach)
+        return reaches
+
+    def get_family_stroke_reaches(self, mobjects):
+        """
+        Returns, by id, how far what is drawn for the family of each
+        member of the families of mobjects reaches past its points
+        """
+        # Every mobject comes after its submobjects here
+        family_members = list(reversed(
+            self.extract_mobject_family_members(mobjects)
+        ))
+        reaches = dict()
+        own_reaches = self.get_stroke_reaches(family_members)
+        for mob, reach in zip(family_members, own_reaches):
+            if mob.get_num_points() == 0:
+                reach = 0
+            for submob in mob.submobjects:
+                reach = max(reach, reaches[id(submob)])
+            reaches[id(mob)] = reach
+        return reaches
+
+    def display_static_layers(self, mobjects):
+        """
+        Copies the last static layer which is still current into
+        the pixel array, and returns those of mobjects which are
+        left to be drawn on top of it.  A layer stays current for
+        as long as the frame, the background, and the render stamps
+        of the mobjects in it and in all layers before it, are the
+        same.  A run of mobjects which were drawn unchanged the last
+        time around is likely to stay so, and becomes a new layer.
+        """
+        stamps = [mob.get_render_stamp() for mob in mobjects]
+        frame_state = self.get_static_layer_frame_state()
+        last_frame_state = self.static_layer_frame_state
+        if last_frame_state is None or not (
+            frame_state[0] is last_frame_state[0] and
+            frame_state[1:] == last_frame_state[1:]
+        ):
+            self.static_layers = []
+        self.static_layer_frame_state = frame_state
+
+        start = 0
+        n_current_layers = 0
+        for layer_stamps, layer in self.static_layers:
+            end = start + len(layer_stamps)
+            if end > len(stamps) or not all(map(
+                render_stamps_match, layer_stamps, stamps[start:end]
+            )):
+                break
+            start = end
+            n_current_layers += 1
+        del self.static_layers[n_current_layers:]
+        if n_current_layers > 0:
+            self.pixel_array[:, :, :] = self.static_layers[-1][1]
+
+        last_stamps = self.static_layer_candidates
+        end = start
+        while end < len(mobjects) and render_stamps_match(
+            stamps[end], last_stamps.get(id(mobjects[end]))
+        ):
+            end += 1
+        self.static_layer_candidates = dict([
+            (id(mob), stamp)
+            for mob, stamp in zip(mobjects, stamps)
+            if stamp is not None
+        ])
+        if end > start and len(self.static_layers) < self.max_static_layers:
+            self.display_mobjects(mobjects[start:end])
+            self.static_layers.append(
+                (stamps[start:end], np.array(self.pixel_array))
+            )
+            start = end
+        return mobjects[start:]
+
+    def display_mobjects(self, mobjects):
         # Organize this list into batches of the same type, and
         # apply corresponding function to those batches
         type_func_pairs = [
             (VMobject, self.display_multiple_vectorized_mobjects),
             (PMobject, self.display_multiple_point_cloud_mobjects),
             (AbstractImageMobject, self.display_multiple_image_mobjects),
+            (TriangleMesh, self.display_multiple_triangle_meshes),
             (Mobject, lambda batch, pa: batch),  # Do nothing
         ]
 
@@ -281,7 +673,7 @@ class Camera(object):
     def get_cairo_context(self, pixel_array):
         cached_ctx = self.get_cached_cairo_context(pixel_array)
         if cached_ctx:
-            return cached_ctx
+            return self.apply_clip_rect(cached_ctx, pixel_array)
         pw = self.get_pixel_width()
         ph = self.get_pixel_height()
         fw = self.get_frame_width()
@@ -301,6 +693,19 @@ class Camera(object):
             (ph / 2) + fc[1] * fdiv(ph, fh),
         ))
         self.cache_cairo_context(pixel_array, ctx)
+        return self.apply_clip_rect(ctx, pixel_array)
+
+    def apply_clip_rect(self, ctx, pixel_array):
+        ctx.reset_clip()
+        if self.clip_rect is not None and pixel_array is self.pixel_array:
+            x0, y0, x1, y1 = self.clip_rect
+            # The clip is given in pixels, not in frame coordinates
+            matrix = ctx.get_matrix()
+            ctx.identity_matrix()
+            ctx.new_path()
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+            ctx.clip()
+            ctx.set_matrix(matrix)
         return ctx
 
     def display_multiple_vectorized_mobjects(self, vmobjects, pixel_array):
@@ -329,6 +734,20 @@ class Camera(object):
         return self
 
     def set_cairo_context_path(self, ctx, vmobject):
+        if self.cache_cairo_paths:
+            # Cairo keeps paths at a fixed precision in pixels, so
+            # a path is only reused at the scale it was built at
+            key = (
+                vmobject.points_version,
+                self.get_frame_width(),
+                self.get_pixel_width(),
+            )
+            cached = self.cairo_path_cache.get(vmobject)
+            if cached is not None and cached[0] == key:
+                ctx.new_path()
+                ctx.append_path(cached[1])
+                return self
+
         points = self.transform_points_pre_display(
             vmobject, vmobject.points
         )
@@ -336,16 +755,26 @@ class Camera(object):
             return
 
         ctx.new_path()
-        subpaths = vmobject.get_subpaths_from_points(points)
-        for subpath in subpaths:
-            quads = vmobject.get_cubic_bezier_tuples_from_points(subpath)
+        nppcc = vmobject.n_points_per_cubic_curve
+        starts, ends = vmobject.get_subpath_bounds_from_points(points)
+        closed = vmobject.consider_points_equals_pointwise(
+            points[starts], points[ends - 1]
+        )
+        # Plain floats are much quicker to hand to cairo
+        # than rows of numpy arrays
+        coords = points[:, :2].tolist()
+        subpath_bounds = zip(starts.tolist(), ends.tolist(), closed.tolist())
+        for start, end, is_closed in subpath_bounds:
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals(subpath[0], subpath[-1]):
+            ctx.move_to(*coords[start])
+            for i in range(start, end - nppcc + 1, nppcc):
+                ctx.curve_to(
+                    *coords[i + 1], *coords[i + 2], *coords[i + 3]
+                )
+            if is_closed:
                 ctx.close_path()
+        if self.cache_cairo_paths:
+            self.cairo_path_cache[vmobject] = (key, ctx.copy_path())
         return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
@@ -418,6 +847,75 @@ class Camera(object):
 
     # Methods for other rendering
 
+    def display_multiple_triangle_meshes(self, meshes, pixel_array):
+        ctx = self.get_cairo_context(pixel_array)
+        for mesh in meshes:
+            self.display_triangle_mesh(mesh, ctx)
+
+    def display_triangle_mesh(self, mesh, ctx):
+        points = self.transform_points_pre_display(mesh, mesh.points)
+        if len(points) != len(mesh.points) or len(mesh.cells) == 0:
+            return self
+        # Plain lists are much quicker to walk through than arrays
+        triangles = points[mesh.cells][:, :, :2].tolist()
+
+        if mesh.has_vertex_colors():
+            self.fill_triangles(ctx, triangles, mesh.vertex_rgbas[mesh.cells])
+        elif np.all(mesh.cell_rgbas == mesh.cell_rgbas[0]):
+            self.set_cairo_context_triangles_path(ctx, triangles)
+            ctx.set_source_rgba(
+                *mesh.cell_rgbas[0][2::-1], mesh.cell_rgbas[0][3]
+            )
+            ctx.fill()
+        else:
+            corner_rgbas = np.repeat(mesh.cell_rgbas[:, np.newaxis], 3, axis=1)
+            self.fill_triangles(ctx, triangles, corner_rgbas)
+
+        width = mesh.get_stroke_width()
+        if width > 0:
+            self.set_cairo_context_triangles_path(ctx, triangles)
+            rgba = mesh.get_stroke_rgba()
+            ctx.set_source_rgba(*rgba[2::-1], rgba[3])
+            ctx.set_line_width(
+                width * self.cairo_line_width_multiple *
+                (self.get_frame_width() / FRAME_WIDTH)
+            )
+            ctx.stroke()
+        return self
+
+    def set_cairo_context_triangles_path(self, ctx, triangles):
+        ctx.new_path()
+        move_to, line_to, close_path = ctx.move_to, ctx.line_to, ctx.close_path
+        for p0, p1, p2 in triangles:
+            move_to(*p0)
+            line_to(*p1)
+            line_to(*p2)
+            close_path()
+
+    def fill_triangles(self, ctx, triangles, corner_rgbas):
+        """
+        Fills each triangle, blending between the colors given
+        for its corners, by painting them all as the patches of
+        one mesh pattern
+        """
+        # Reversed rgb, as the cairo surface stores it that way
+        corner_rgbas = corner_rgbas[:, :, [2, 1, 0, 3]].tolist()
+        pattern = cairo.MeshPattern()
+        begin_patch, end_patch = pattern.begin_patch, pattern.end_patch
+        move_to, line_to = pattern.move_to, pattern.line_to
+        set_corner_color = pattern.set_corner_color_rgba
+        for (p0, p1, p2), (c0, c1, c2) in zip(triangles, corner_rgbas):
+            begin_patch()
+            move_to(*p0)
+            line_to(*p1)
+            line_to(*p2)
+            set_corner_color(0, *c0)
+            set_corner_color(1, *c1)
+            set_corner_color(2, *c2)
+            end_patch()
+        ctx.set_source(pattern)
+        ctx.paint()
+
     def display_multiple_point_cloud_mobjects(self, pmobjects, pixel_array):
         for pmobject in pmobjects:
             self.display_point_cloud(
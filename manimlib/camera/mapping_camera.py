@@ -13,7 +13,12 @@ class MappingCamera(Camera):
     CONFIG = {
         "mapping_func": lambda p: p,
         "min_num_curves": 50,
-        "allow_object_intrusion": False
+        "allow_object_intrusion": False,
+        # Mobjects are copied before being drawn, and how they
+        # are drawn depends on mapping_func
+        "use_static_layers": False,
+        "use_dirty_rects": False,
+        "cull_offscreen_mobjects": False,
     }
 
     def points_to_pixel_coords(self, points):
@@ -44,6 +49,12 @@ class MappingCamera(Camera):
 
 # TODO, the classes below should likely be deleted
 class OldMultiCamera(Camera):
+    CONFIG = {
+        # The pixel array is written into directly, without
+        # keeping track of which pixels were touched
+        "use_dirty_rects": False,
+    }
+
     def __init__(self, *cameras_with_start_positions, **kwargs):
         self.shifted_cameras = [
             DictAsObject(
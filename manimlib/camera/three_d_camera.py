@@ -27,6 +27,12 @@ class ThreeDCamera(Camera):
         "should_apply_shading": True,
         "exponential_projection": False,
         "max_allowable_norm": 3 * FRAME_WIDTH,
+        # How mobjects are drawn depends on the orientation of the
+        # camera, which render stamps, cached paths and bounding
+        # boxes say nothing about
+        "use_static_layers": False,
+        "cache_cairo_paths": False,
+        "cull_offscreen_mobjects": False,
     }
 
     def __init__(self, *args, **kwargs):
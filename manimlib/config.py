@@ -97,6 +97,26 @@ def parse_cli():
             action="store_true",
             help="Leave progress bars displayed in terminal",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes used to render the animations "
+                 "of a scene in parallel",
+        )
+        parser.add_argument(
+            "--frame_workers",
+            type=int,
+            default=1,
+            help="Number of processes used to render the frames "
+                 "within a single animation in parallel",
+        )
+        parser.add_argument(
+            "--disable_caching",
+            action="store_true",
+            help="Render every animation, even when an identical "
+                 "one has a cached partial movie file",
+        )
 
         # For live streaming
         module_location.add_argument(
@@ -145,6 +165,9 @@ def get_module(file_name):
         module_name = file_name.replace(os.sep, ".").replace(".py", "")
         spec = importlib.util.spec_from_file_location(module_name, file_name)
         module = importlib.util.module_from_spec(spec)
+        # Registering the module lets worker processes unpickle
+        # the scene classes defined in it
+        sys.modules[module_name] = module
         spec.loader.exec_module(module)
         return module
 
@@ -159,6 +182,7 @@ def get_configuration(args):
         "png_mode": "RGBA" if args.transparent else "RGB",
         "movie_file_extension": ".mov" if args.transparent else ".mp4",
         "file_name": args.file_name,
+        "cache_partial_movies": not args.disable_caching,
     }
     if hasattr(module, "OUTPUT_DIRECTORY"):
         file_writer_config["output_directory"] = module.OUTPUT_DIRECTORY
@@ -174,7 +198,9 @@ def get_configuration(args):
         "start_at_animation_number": args.start_at_animation_number,
         "end_at_animation_number": None,
         "sound": args.sound,
-        "leave_progress_bars": args.leave_progress_bars
+        "leave_progress_bars": args.leave_progress_bars,
+        "workers": args.workers,
+        "frame_workers": args.frame_workers,
     }
 
     # Camera configuration
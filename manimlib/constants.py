@@ -26,6 +26,7 @@ VIDEO_DIR = os.path.join(MEDIA_DIR, "videos")
 RASTER_IMAGE_DIR = os.path.join(MEDIA_DIR, "designs", "raster_images")
 SVG_IMAGE_DIR = os.path.join(MEDIA_DIR, "designs", "svg_images")
 SOUND_DIR = os.path.join(MEDIA_DIR, "designs", "sounds")
+MESH_DIR = os.path.join(MEDIA_DIR, "designs", "meshes")
 ###
 THIS_DIR = os.path.dirname(os.path.realpath(__file__))
 FILE_DIR = os.path.join(os.getenv("FILE_DIR", default=THIS_DIR), "files")
@@ -33,9 +34,12 @@ TEX_DIR = os.path.join(FILE_DIR, "Tex")
 # These two may be depricated now.
 MOBJECT_DIR = os.path.join(FILE_DIR, "mobjects")
 IMAGE_MOBJECT_DIR = os.path.join(MOBJECT_DIR, "image")
+SVG_CACHE_DIR = os.path.join(FILE_DIR, "svg_cache")
+MESH_CACHE_DIR = os.path.join(FILE_DIR, "meshes")
 
 for folder in [FILE_DIR, RASTER_IMAGE_DIR, SVG_IMAGE_DIR, VIDEO_DIR,
-               TEX_DIR, MOBJECT_DIR, IMAGE_MOBJECT_DIR]:
+               TEX_DIR, MOBJECT_DIR, IMAGE_MOBJECT_DIR, SVG_CACHE_DIR,
+               MESH_CACHE_DIR]:
     if not os.path.exists(folder):
         os.makedirs(folder)
 
@@ -1,11 +1,13 @@
 import inspect
 import itertools as it
+import multiprocessing as mp
 import os
 import platform
 import subprocess as sp
 import sys
 import traceback
 
+from manimlib.mobject.svg.tex_mobject import compile_tex_in_module
 from manimlib.scene.scene import Scene, EndSceneEarlyException
 from manimlib.utils.sounds import play_error_sound
 from manimlib.utils.sounds import play_finish_sound
@@ -128,6 +130,104 @@ def get_scene_classes_from_module(module):
         ]
 
 
+def get_animation_ranges(durations, start, end, n_ranges):
+    """
+    Splits the animations numbered start through end - 1 into
+    at most n_ranges contiguous ranges, each covering roughly the
+    same total duration of video.  end is clamped to the number
+    of animations, and no ranges are returned if none are left.
+    """
+    end = min(end, len(durations))
+    if start >= end:
+        return []
+    total_duration = sum(durations[start:end])
+    ranges = []
+    range_start = start
+    elapsed = 0
+    for index in range(start, end - 1):
+        elapsed += durations[index]
+        threshold = total_duration * (len(ranges) + 1) / n_ranges
+        if elapsed >= threshold and len(ranges) < n_ranges - 1:
+            ranges.append((range_start, index + 1))
+            range_start = index + 1
+    ranges.append((range_start, end))
+    return ranges
+
+
+def render_animation_range(SceneClass, scene_kwargs, start, end):
+    """
+    Runs through the scene, skipping up to the animation numbered
+    start, and writes the partial movie files for the animations
+    up to (but not including) the one numbered end.  Skipped
+    animations are stepped through frame by frame, so that each
+    range starts from just the state a serial render reaches.
+    Returns how long was spent waiting on the encoder.
+    """
+    scene = SceneClass(**dict(
+        scene_kwargs,
+        skip_animations=(start > 0),
+        start_at_animation_number=start,
+        end_at_animation_number=end,
+        step_through_skipped_animations=True,
+    ))
+    try:
+        scene.construct()
+    except EndSceneEarlyException:
+        pass
+    return scene.file_writer.time_blocked_on_encoder
+
+
+def get_process_context():
+    # Forked workers inherit the scene module without
+    # having to import it again
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+def render_scene_in_parallel(SceneClass, scene_kwargs, n_workers):
+    # A first pass through the scene, with all rendering skipped,
+    # records how many animations there are and how long they last
+    scene = SceneClass(**dict(
+        scene_kwargs,
+        skip_animations=True,
+        start_at_animation_number=None,
+    ))
+    try:
+        scene.construct()
+    except EndSceneEarlyException:
+        pass
+
+    start, end = get_animation_bounds(scene, scene_kwargs)
+    ranges = get_animation_ranges(
+        scene.segment_durations, start, end, n_workers
+    )
+    if len(ranges) == 0:
+        return scene
+    with get_process_context().Pool(len(ranges)) as pool:
+        times_blocked_on_encoder = pool.starmap(render_animation_range, [
+            (SceneClass, scene_kwargs, range_start, range_end)
+            for range_start, range_end in ranges
+        ])
+    # The first pass wrote no frames, so the time reported
+    # is that which the workers spent waiting
+    scene.file_writer.time_blocked_on_encoder = sum(times_blocked_on_encoder)
+    return scene
+
+
+def get_animation_bounds(scene, scene_kwargs):
+    if scene_kwargs["start_at_animation_number"] is not None:
+        f_start = scene_kwargs["start_at_animation_number"]
+    else:
+        f_start = 0
+
+    if scene_kwargs["end_at_animation_number"] is not None:
+        f_end = scene_kwargs["end_at_animation_number"]
+    else:
+        f_end = scene.num_plays
+    return f_start, f_end
+
+
 def main(config):
     module = config["module"]
     all_scene_classes = get_scene_classes_from_module(module)
@@ -142,29 +242,27 @@ def main(config):
             "start_at_animation_number",
             "end_at_animation_number",
             "leave_progress_bars",
+            "frame_workers",
         ]
     ])
 
+    # Start compiling any tex the scenes will need while they are set up
+    compile_tex_in_module(module)
+
     for SceneClass in scene_classes_to_render:
         try:
-
-            scene = SceneClass(**scene_kwargs)
-
-            try:
-                scene.construct()
-            except EndSceneEarlyException:
-                pass
-
-            if scene.start_at_animation_number is not None:
-                f_start = scene.start_at_animation_number
-            else:
-                f_start = 0
-
-            if scene.end_at_animation_number is not None:
-                f_end = scene.end_at_animation_number
+            if config["workers"] > 1:
+                scene = render_scene_in_parallel(
+                    SceneClass, scene_kwargs, config["workers"]
+                )
             else:
-                f_end = scene.num_plays
+                scene = SceneClass(**scene_kwargs)
+                try:
+                    scene.construct()
+                except EndSceneEarlyException:
+                    pass
 
+            f_start, f_end = get_animation_bounds(scene, scene_kwargs)
             scene.file_writer.finish([f_start, f_end])
             scene.print_end_message()
 
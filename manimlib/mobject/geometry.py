@@ -311,6 +311,7 @@ class Dot(Circle):
         "fill_opacity": 1.0,
         "color": WHITE
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
     def __init__(self, point=ORIGIN, **kwargs):
         Circle.__init__(self, arc_center=point, **kwargs)
@@ -320,6 +321,7 @@ class SmallDot(Dot):
     CONFIG = {
         "radius": DEFAULT_SMALL_DOT_RADIUS,
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
 
 class Ellipse(Circle):
@@ -394,6 +396,7 @@ class Line(TipableVMobject):
         "buff": 0,
         "path_arc": None,  # angle of arc specified here
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
     def __init__(self, start, end, **kwargs):
         digest_config(self, kwargs)
@@ -561,6 +564,7 @@ class Arrow(Line):
         "rectangular_stem_width": 0.05,
         "make_amends": False
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
     def __init__(self, *args, **kwargs):
         Line.__init__(self, *args, **kwargs)
@@ -609,16 +613,13 @@ class Arrow(Line):
         self.get_tips().set_stroke(width=0)
         return self
 
-    # TODO, should this be the default for everything?
-    def copy(self):
-        return self.deepcopy()
-
 
 class Vector(Arrow):
     CONFIG = {
         "color": YELLOW,
         "buff": 0,
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
     def __init__(self, direction, **kwargs):
         if len(direction) == 2:
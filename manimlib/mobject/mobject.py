@@ -5,6 +5,7 @@ import operator as op
 import os
 import random
 import sys
+import weakref
 
 from colour import Color
 import numpy as np
@@ -28,10 +29,69 @@ from manimlib.utils.space_ops import rotation_matrix
 
 # TODO: Explain array_attrs
 
+# Which attributes hold arrays and which hold mobjects, by the
+# class of a mobject and the names and types of its attributes
+COPY_ATTRS_CACHE = dict()
+
+
+class SubmobjectList(list):
+    """
+    The list held by Mobject.submobjects, which tells the mobject
+    holding it of every change made to it in place, e.g. by
+    appending to or sorting it, so that its cached family and
+    bounding boxes, and those of its parents, are recomputed
+    """
+    owner_ref = None
+
+    def __init__(self, submobjects=(), owner=None):
+        super().__init__(submobjects)
+        if owner is not None:
+            self.owner_ref = weakref.ref(owner)
+
+    def __reduce__(self):
+        # The owner is set again by whichever mobject takes this on
+        return (SubmobjectList, (list(self),))
+
+
+def noting_changed_family(method):
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        owner = self.owner_ref and self.owner_ref()
+        if owner is not None:
+            owner.note_changed_family()
+        return result
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+for method_name in [
+    "append", "extend", "insert", "remove", "pop", "clear",
+    "sort", "reverse", "__setitem__", "__delitem__",
+    "__iadd__", "__imul__",
+]:
+    setattr(
+        SubmobjectList, method_name,
+        noting_changed_family(getattr(list, method_name))
+    )
+
+
 class Mobject(object):
     """
     Mathematical Object
     """
+    # Every change to the points of a mobject takes a new number
+    # from this counter, see points_version
+    version_counter = it.count(1)
+    # Attributes which are only derived from the others, and
+    # so are left out when copying, pickling or hashing
+    CACHE_ATTRS = [
+        "_points_version", "family_cache", "box_caches",
+        "cache_parents", "packed_points", "_packed_buffer",
+    ]
+    # Mobjects made in large numbers set this, so that their CONFIG
+    # lives on the class rather than in every instance's __dict__.
+    # Subclasses don't inherit it, and must set it again to opt in.
+    CONFIG_AS_CLASS_DEFAULTS = False
 
     def __init__(self, color=WHITE, name=None, dim=3, target=None, **kwargs):
 
@@ -51,6 +111,111 @@ class Mobject(object):
     def __str__(self):
         return str(self.name)
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for attr in self.CACHE_ATTRS:
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._submobjects = SubmobjectList(self._submobjects, self)
+        self.note_changed_points()
+
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        # While self is packed, see pack_family_points, new points
+        # of the same shape are written into its part of the packed
+        # array, so that the family stays packed
+        packed_buffer = self.__dict__.get("_packed_buffer")
+        if packed_buffer is not None and points is not self._points and \
+                self._points.base is packed_buffer and \
+                np.shape(points) == self._points.shape:
+            self._points[:] = points
+        else:
+            self._points = points
+        self.note_changed_points()
+
+    @property
+    def submobjects(self):
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        owner_ref = getattr(submobjects, "owner_ref", None)
+        if owner_ref is None or owner_ref() is not self:
+            submobjects = SubmobjectList(submobjects, self)
+        self._submobjects = submobjects
+        self.note_changed_family()
+
+    @property
+    def points_version(self):
+        """
+        A number which changes whenever the points of self do
+        """
+        return self._points_version
+
+    def note_changed_points(self):
+        """
+        Gives self a new points version, and drops the bounding
+        boxes cached by self and by everything containing it.
+        Assigning to self.points calls this, but anything writing
+        into self.points in place must call it afterwards.
+        """
+        self._points_version = next(Mobject.version_counter)
+        self.clear_caches(clear_families=False)
+        return self
+
+    def note_changed_family(self):
+        """
+        Drops the families and bounding boxes cached by self and
+        by everything containing it.  Assigning to self.submobjects,
+        or changing it in place, calls this already.
+        """
+        self.clear_caches(clear_families=True)
+        return self
+
+    def clear_caches(self, clear_families):
+        # Mobjects caching anything worked out from their submobjects
+        # add themselves to the cache_parents of those, so that this
+        # need only walk up from self to them.  Once a mobject has
+        # nothing cached, neither has anything containing it.
+        to_clear = [self]
+        while to_clear:
+            mob = to_clear.pop()
+            attrs = mob.__dict__
+            has_family = clear_families and "family_cache" in attrs
+            if not attrs.get("box_caches") and not has_family:
+                continue
+            attrs["box_caches"] = dict()
+            if has_family:
+                del attrs["family_cache"]
+            for parent_ref in attrs.get("cache_parents", dict()).values():
+                parent = parent_ref()
+                if parent is not None:
+                    to_clear.append(parent)
+
+    def note_cache_parent(self, parent):
+        # Weak references to these parents, by their ids
+        cache_parents = self.__dict__.get("cache_parents")
+        if cache_parents is None:
+            cache_parents = self.cache_parents = dict()
+        parent_ref = cache_parents.get(id(parent))
+        if parent_ref is None or parent_ref() is not parent:
+            cache_parents[id(parent)] = weakref.ref(parent)
+
+    def get_render_stamp(self):
+        """
+        Returns a tuple whose entries stay the very same objects for
+        as long as the way self is drawn stays the same, so cameras
+        can reuse images of it, or None when that can't be told.
+        """
+        return None
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
@@ -115,25 +280,99 @@ class Mobject(object):
         )
 
     def copy(self):
-        # TODO, either justify reason for shallow copy, or
-        # remove this redundancy everywhere
-        # return self.deepcopy()
-
-        copy_mobject = copy.copy(self)
-        copy_mobject.points = np.array(self.points)
-        copy_mobject.submobjects = [
-            submob.copy() for submob in self.submobjects
-        ]
-        copy_mobject.updaters = list(self.updaters)
-        family = self.get_family()
-        for attr, value in list(self.__dict__.items()):
-            if (isinstance(value, Mobject)
-                    and value in family and value is not self):
-                setattr(copy_mobject, attr, value.copy())
-            if isinstance(value, np.ndarray):
-                setattr(copy_mobject, attr, np.array(value))
+        """
+        Copies self along with its whole family.  Attributes which
+        refer to members of the family refer to their copies in the
+        result, and writable arrays are copied, while everything
+        else is shared with the original.
+        """
+        memo = dict()
+        copy_mobject = self.copy_into(memo)
+        Mobject.relink_copies(memo)
+        return copy_mobject
+
+    def copy_into(self, memo):
+        """
+        Copies self and its family, adding each copy to memo, by
+        the id of its original.  Attributes of the copies still
+        refer to the originals until relink_copies(memo) is called,
+        so that many mobjects can be copied together first.
+        """
+        if id(self) in memo:
+            return memo[id(self)]
+        if type(self).copy is not Mobject.copy:
+            # Respect copy methods of subclasses
+            copy_mobject = self.copy()
+            family = self.get_family()
+            copy_family = copy_mobject.get_family()
+            if len(family) != len(copy_family):
+                family, copy_family = [self], [copy_mobject]
+            for mob, copy_mob in zip(family, copy_family):
+                memo.setdefault(id(mob), copy_mob)
+            return copy_mobject
+
+        # Filling in __dict__ directly skips the machinery of
+        # copy.copy and the points and submobjects setters, which
+        # dominate the time taken to copy large families
+        Class = self.__class__
+        copy_mobject = Class.__new__(Class)
+        memo[id(self)] = copy_mobject
+        state = dict(self.__dict__)
+        for attr in self.CACHE_ATTRS:
+            state.pop(attr, None)
+        for attr in self.get_copy_attrs()[0]:
+            # Read-only arrays, like interned styles, can be shared
+            if state[attr].flags.writeable:
+                state[attr] = np.array(state[attr])
+        state["_points"] = np.array(self._points)
+        state["_points_version"] = next(Mobject.version_counter)
+        state["updaters"] = list(self.updaters)
+        copy_mobject.__dict__ = state
+        copy_mobject._submobjects = SubmobjectList([
+            submob.copy_into(memo) for submob in self._submobjects
+        ], copy_mobject)
         return copy_mobject
 
+    @staticmethod
+    def relink_copies(memo):
+        """
+        Points attributes of the copies in memo which refer to
+        mobjects that were copied at their copies instead
+        """
+        for copy_mobject in list(memo.values()):
+            if not isinstance(copy_mobject, Mobject):
+                continue
+            attrs = copy_mobject.__dict__
+            for attr in copy_mobject.get_copy_attrs()[1]:
+                new_value = memo.get(id(attrs[attr]))
+                if new_value is not None:
+                    attrs[attr] = new_value
+
+    def get_copy_attrs(self):
+        """
+        Returns the names of the attributes of self, other than its
+        points, holding arrays, and those holding mobjects.  These are
+        only worked out once for each class and each set of names and
+        types of attributes, which mobjects made alike all share.
+        """
+        keys = tuple(self.__dict__)
+        types = tuple(map(type, self.__dict__.values()))
+        cache_key = (self.__class__, keys, types)
+        entry = COPY_ATTRS_CACHE.get(cache_key)
+        if entry is None:
+            array_attrs = [
+                key for key, value_type in zip(keys, types)
+                if issubclass(value_type, np.ndarray) and key != "_points" and
+                key not in self.CACHE_ATTRS
+            ]
+            mobject_attrs = [
+                key for key, value_type in zip(keys, types)
+                if issubclass(value_type, Mobject)
+            ]
+            entry = (array_attrs, mobject_attrs)
+            COPY_ATTRS_CACHE[cache_key] = entry
+        return entry
+
     def deepcopy(self):
         return copy.deepcopy(self)
 
@@ -220,9 +459,14 @@ class Mobject(object):
 
     def shift(self, *vectors):
         total_vector = reduce(op.add, vectors)
+        packed_points = self.get_packed_points()
+        if packed_points is not None:
+            packed_points += total_vector
+            for mob in self.family_members_with_points():
+                mob.note_changed_points()
+            return self
         for mob in self.family_members_with_points():
-            mob.points = mob.points.astype('float')
-            mob.points += total_vector
+            mob.points = mob.points.astype('float') + total_vector
         return self
 
     def scale(self, scale_factor, **kwargs):
@@ -347,12 +591,62 @@ class Mobject(object):
             if about_edge is None:
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
+        packed_points = self.get_packed_points()
+        if packed_points is not None:
+            packed_points[:] = func(packed_points - about_point) + about_point
+            for mob in self.family_members_with_points():
+                mob.note_changed_points()
+            return self
         for mob in self.family_members_with_points():
-            mob.points -= about_point
-            mob.points = func(mob.points)
-            mob.points += about_point
+            mob.points = func(mob.points - about_point) + about_point
+        return self
+
+    def pack_family_points(self):
+        """
+        Moves the points of every mobject in the family into
+        one contiguous array, with each of their points becoming
+        a view into it.  Shifting, scaling, rotating and other
+        functions of points applied to self then act on that
+        array all at once, rather than on each member in turn.
+
+        Members given new points of the same shape, e.g. by
+        mob.points = mob.points.astype(float), keep them in the packed
+        array.  When the family changes, or a member's points change
+        shape, get_packed_points packs the family again.
+        """
+        family = self.family_members_with_points()
+        if len(family) == 0:
+            return self
+        packed_points = np.concatenate([
+            mob.points for mob in family
+        ]).astype(float)
+        start = 0
+        for mob in family:
+            end = start + len(mob.points)
+            mob._packed_buffer = None
+            mob.points = packed_points[start:end]
+            mob._packed_buffer = packed_points
+            start = end
+        self.packed_points = packed_points
         return self
 
+    def get_packed_points(self):
+        """
+        Returns the array from the last call to pack_family_points,
+        packing the family again first if the points of its members
+        no longer make up all of that array, or None if the family
+        was never packed.
+        """
+        packed_points = getattr(self, "packed_points", None)
+        if packed_points is None:
+            return None
+        family = self.family_members_with_points()
+        if any(mob.points.base is not packed_points for mob in family) or \
+                sum(len(mob.points) for mob in family) != len(packed_points):
+            self.pack_family_points()
+            packed_points = getattr(self, "packed_points", None)
+        return packed_points
+
     def rotate_in_place(self, angle, axis=OUT):
         # redundant with default behavior of rotate now.
         return self.rotate(angle, axis=axis)
@@ -691,14 +985,15 @@ class Mobject(object):
         ]
 
     def get_merged_array(self, array_attr):
-        result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(
-                result, submob.get_merged_array(array_attr),
-                axis=0
-            )
-            submob.get_merged_array(array_attr)
-        return result
+        arrays = []
+
+        def collect(mob):
+            arrays.append(getattr(mob, array_attr))
+            for submob in mob.submobjects:
+                collect(submob)
+
+        collect(self)
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self):
         return self.get_merged_array("points")
@@ -713,7 +1008,7 @@ class Mobject(object):
 
     def get_extremum_along_dim(self, points=None, dim=0, key=0):
         if points is None:
-            points = self.get_points_defining_boundary()
+            return self.get_critical_point(key * np.identity(self.dim)[dim])[dim]
         values = points[:, dim]
         if key < 0:
             return np.min(values)
@@ -728,15 +1023,84 @@ class Mobject(object):
         9 'critical points': 4 corners, 4 edge center, the
         center.  This returns one of them.
         """
-        result = np.zeros(self.dim)
-        all_points = self.get_points_defining_boundary()
-        if len(all_points) == 0:
-            return result
-        for dim in range(self.dim):
-            result[dim] = self.get_extremum_along_dim(
-                all_points, dim=dim, key=direction[dim]
-            )
-        return result
+        bounding_box = self.get_bounding_box()
+        if bounding_box is None:
+            return np.zeros(self.dim)
+        mins, maxs = bounding_box
+        direction = np.array(direction)[:self.dim]
+        return np.where(
+            direction < 0, mins,
+            np.where(direction > 0, maxs, (mins + maxs) / 2)
+        )
+
+    def get_bounding_box(self):
+        """
+        Returns an array whose rows are the minimum and the
+        maximum, along each dimension, of the points defining
+        the boundary of the mobject, or None if it has no points.
+        """
+        return self.get_family_box("points")
+
+    def get_display_points(self):
+        """
+        Returns points whose convex hull holds everything drawn
+        for self alone, apart from the width of strokes
+        """
+        return self.points
+
+    def get_display_bounding_box(self):
+        """
+        Like get_bounding_box, but around everything drawn for the
+        family, so e.g. the handles of curves count as well as their
+        anchors.
+        """
+        return self.get_family_box("display")
+
+    def get_box_points(self, kind):
+        """
+        The points of self alone, not its submobjects, which
+        get_family_box(kind) bounds
+        """
+        if kind == "display":
+            return self.get_display_points()
+        return self.points
+
+    def get_family_box(self, kind):
+        """
+        Returns the bounding box of the points given by
+        get_box_points(kind) for all of the family, or None if there
+        are none.  This is built up from the boxes of the submobjects,
+        and kept until the points of something in the family, or the
+        family itself, changes.
+        """
+        box_caches = self.__dict__.get("box_caches")
+        if box_caches is None:
+            box_caches = self.box_caches = dict()
+        elif kind in box_caches:
+            return box_caches[kind]
+        boxes = []
+        for submob in self.submobjects:
+            submob.note_cache_parent(self)
+            box = submob.get_family_box(kind)
+            if box is not None:
+                boxes.append(box)
+        points = self.get_box_points(kind)
+        if len(points) > 0:
+            boxes.append(np.array([
+                np.min(points, axis=0),
+                np.max(points, axis=0),
+            ]))
+        if len(boxes) == 0:
+            bounding_box = None
+        elif len(boxes) == 1:
+            bounding_box = boxes[0]
+        else:
+            bounding_box = np.array([
+                np.min([box[0] for box in boxes], axis=0),
+                np.max([box[1] for box in boxes], axis=0),
+            ])
+        box_caches[kind] = bounding_box
+        return bounding_box
 
     # Pseudonyms for more general get_critical_point method
 
@@ -922,9 +1286,17 @@ class Mobject(object):
         return result + self.submobjects
 
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        # Kept until the submobjects of something in the family change
+        family = self.__dict__.get("family_cache")
+        if family is None:
+            sub_families = []
+            for submob in self.submobjects:
+                submob.note_cache_parent(self)
+                sub_families.append(submob.get_family())
+            all_mobjects = [self] + list(it.chain(*sub_families))
+            family = remove_list_redundancies(all_mobjects)
+            self.family_cache = family
+        return list(family)
 
     def family_members_with_points(self):
         return [m for m in self.get_family() if m.get_num_points() > 0]
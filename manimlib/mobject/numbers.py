@@ -1,6 +1,14 @@
 from manimlib.constants import *
 from manimlib.mobject.svg.tex_mobject import SingleStringTexMobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.hashing import get_hash_from_objects
+from manimlib.utils.tex_file_writing import tex_to_svg_files
+
+
+# Prototype glyphs, keyed by character and by a hash of the config
+# they were built with.  DecimalNumbers copy these rather than
+# compiling and parsing tex for each of their characters.
+glyph_cache = dict()
 
 
 class DecimalNumber(VMobject):
@@ -14,60 +22,149 @@ class DecimalNumber(VMobject):
         "include_background_rectangle": False,
         "edge_to_fix": LEFT,
     }
+    # Glyphs built together the first time one of them is
+    # needed in a given style
+    glyph_chars = "0123456789-+.,"
 
     def __init__(self, number=0, **kwargs):
         super().__init__(**kwargs)
         self.number = number
         self.initial_config = kwargs
 
+        settings = self.get_settings()
+        num_string, glyphs = self.get_glyph_prototypes(
+            number, settings, kwargs
+        )
+        shifts = self.get_glyph_shifts(glyphs, num_string, settings)
+        self.add(*[
+            glyph.copy().shift(shift)
+            for glyph, shift in zip(glyphs, shifts)
+        ])
+        if self.unit is not None:
+            self.unit_sign = self.submobjects[-1]
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def get_settings(self, config={}):
+        # The values of CONFIG keys for self, with those in config
+        # taking priority
+        return dict([
+            (key, config.get(key, getattr(self, key)))
+            for key in DecimalNumber.CONFIG
+        ])
+
+    def get_num_string(self, number, settings):
+        formatter_config = dict([
+            (key, settings[key])
+            for key in [
+                "include_sign",
+                "group_with_commas",
+                "num_decimal_places",
+            ]
+        ])
         if isinstance(number, complex):
-            formatter = self.get_complex_formatter()
+            formatter = self.get_complex_formatter(**formatter_config)
         else:
-            formatter = self.get_formatter()
+            formatter = self.get_formatter(**formatter_config)
         num_string = formatter.format(number)
 
-        rounded_num = np.round(number, self.num_decimal_places)
+        rounded_num = np.round(number, settings["num_decimal_places"])
         if num_string.startswith("-") and rounded_num == 0:
-            if self.include_sign:
+            if settings["include_sign"]:
                 num_string = "+" + num_string[1:]
             else:
                 num_string = num_string[1:]
+        return num_string
 
-        self.add(*[SingleStringTexMobject(char, **kwargs)
-                   for char in num_string])
+    def get_glyph_prototypes(self, number, settings, config):
+        """
+        Returns the string number is written as, and the cached
+        glyphs for each of its characters, followed by those for
+        the ellipsis and unit, if there are any
+        """
+        num_string = self.get_num_string(number, settings)
+        glyphs = [
+            self.get_glyph_prototype(char, config)
+            for char in num_string
+        ]
+        if settings["show_ellipsis"]:
+            glyphs.append(self.get_glyph_prototype("\\dots", {}))
+        if settings["unit"] is not None:
+            glyphs.append(self.get_glyph_prototype(
+                settings["unit"], {"color": config.get("color", self.color)}
+            ))
+        return num_string, glyphs
 
-        # Add non-numerical bits
-        if self.show_ellipsis:
-            self.add(SingleStringTexMobject("\\dots"))
+    def get_glyph_shifts(self, glyphs, num_string, settings):
+        """
+        Returns how far each of glyphs is to be shifted so that
+        they sit side by side, aligned along their bottoms, and
+        centered on the origin, apart from minus signs, commas and
+        superscript units, which are raised or lowered.  This only
+        works with the bounding boxes of glyphs, so it is as cheap
+        for set_value to lay out a new number as it is here.
+        """
+        boxes = []
+        for glyph in glyphs:
+            box = glyph.get_bounding_box()
+            boxes.append(np.zeros((2, self.dim)) if box is None else box)
+        boxes = np.array(boxes)
+        centers = boxes.mean(axis=1)
+        buff = settings["digit_to_digit_buff"]
+        shifts = np.zeros((len(glyphs), self.dim))
+        # Each glyph goes next to the one before, aligned to its bottom
+        for i in range(1, len(glyphs)):
+            shifts[i] = shifts[i - 1] + buff * RIGHT
+            shifts[i, 0] += boxes[i - 1, 1, 0] - boxes[i, 0, 0]
+            shifts[i, 1] += boxes[i - 1, 0, 1] - boxes[i, 0, 1]
+            shifts[i, 2] += centers[i - 1, 2] - centers[i, 2]
+        if len(glyphs) > 0:
+            placed_boxes = boxes + shifts[:, np.newaxis, :]
+            shifts -= (
+                placed_boxes[:, 0].min(axis=0) +
+                placed_boxes[:, 1].max(axis=0)
+            ) / 2
 
-        if num_string.startswith("-"):
-            minus = self.submobjects[0]
-            minus.next_to(
-                self.submobjects[1], LEFT,
-                buff=self.digit_to_digit_buff
-            )
+        def get_top(i):
+            return boxes[i, 1, 1] + shifts[i, 1]
 
-        if self.unit is not None:
-            self.unit_sign = SingleStringTexMobject(self.unit, color=self.color)
-            self.add(self.unit_sign)
+        for i, char in enumerate(num_string):
+            if char == "-":
+                # The top of a minus sign goes level with the
+                # middle of what follows it
+                shifts[i, 1] += centers[i + 1, 1] + shifts[i + 1, 1] - get_top(i)
+            elif char == ",":
+                shifts[i, 1] -= glyphs[i].get_height() / 2
+        unit = settings["unit"]
+        if unit and unit.startswith("^"):
+            shifts[-1, 1] += max(map(get_top, range(len(glyphs)))) - get_top(-1)
+        return shifts
 
-        self.arrange(
-            buff=self.digit_to_digit_buff,
-            aligned_edge=DOWN
-        )
+    def get_glyph_prototype(self, char, config):
+        # Settings for the number itself don't change its glyphs
+        config = dict([
+            (key, value)
+            for key, value in config.items()
+            if key not in DecimalNumber.CONFIG
+        ])
+        style_key = get_hash_from_objects(config)
+        if (char, style_key) not in glyph_cache:
+            chars = [char]
+            if char in self.glyph_chars:
+                chars += [
+                    c for c in self.glyph_chars
+                    if c != char and (c, style_key) not in glyph_cache
+                ]
+            # Compile all of them with a single run of latex
+            tex_to_svg_files(*SingleStringTexMobject.get_modified_expressions(
+                chars, **config
+            ))
+            for c in chars:
+                glyph_cache[(c, style_key)] = SingleStringTexMobject(c, **config)
+        return glyph_cache[(char, style_key)]
 
-        # Handle alignment of parts that should be aligned
-        # to the bottom
-        for i, c in enumerate(num_string):
-            if c == "-":
-                self[i].align_to(self[i + 1], alignment_vect=UP)
-            elif c == ",":
-                self[i].shift(self[i].get_height() * DOWN / 2)
-        if self.unit and self.unit.startswith("^"):
-            self.unit_sign.align_to(self, UP)
-        #
-        if self.include_background_rectangle:
-            self.add_background_rectangle()
+    def get_glyph(self, char, config):
+        return self.get_glyph_prototype(char, config).copy()
 
     def get_formatter(self, **kwargs):
         """
@@ -106,26 +203,94 @@ class DecimalNumber(VMobject):
         ])
 
     def set_value(self, number, **config):
-        full_config = dict(self.CONFIG)
-        full_config.update(self.initial_config)
-        full_config.update(config)
-        new_decimal = DecimalNumber(number, **full_config)
-        # Make sure last digit has constant height
-        new_decimal.scale(
-            self[-1].get_height() / new_decimal[-1].get_height()
+        """
+        Lays out the glyphs of number just as a new DecimalNumber
+        would be, scaled so that the last character keeps its height,
+        and moved so that edge_to_fix stays where it is.  The points
+        of the cached glyphs are written straight into the characters
+        of self, wherever those have the same structure.
+        """
+        settings = self.get_settings(config)
+        glyph_config = dict(self.initial_config)
+        glyph_config.update(config)
+        num_string, glyphs = self.get_glyph_prototypes(
+            number, settings, glyph_config
         )
-        new_decimal.move_to(self, self.edge_to_fix)
-        new_decimal.match_style(self)
+        shifts = self.get_glyph_shifts(glyphs, num_string, settings)
 
         old_family = self.get_family()
-        self.submobjects = new_decimal.submobjects
+        old_chars = [
+            submob for submob in self.submobjects
+            if submob is not getattr(self, "background_rectangle", None)
+        ]
+        # Each glyph point p ends up at scale_factor * p + offsets[i]
+        scale_factor = old_chars[-1].get_height() / glyphs[-1].get_height()
+        placed_boxes = np.array([
+            glyph.get_bounding_box() + shift
+            for glyph, shift in zip(glyphs, shifts)
+        ])
+        new_box = np.array([
+            placed_boxes[:, 0].min(axis=0),
+            placed_boxes[:, 1].max(axis=0),
+        ])
+        old_box = np.array([
+            np.min([char.get_bounding_box()[0] for char in old_chars], axis=0),
+            np.max([char.get_bounding_box()[1] for char in old_chars], axis=0),
+        ])
+        offsets = scale_factor * shifts + (
+            self.get_box_point(old_box, settings["edge_to_fix"]) -
+            scale_factor * self.get_box_point(new_box, settings["edge_to_fix"])
+        )
+
+        # Characters are kept wherever the glyph in their place has the
+        # same structure, only taking on the new points
+        new_chars = []
+        for i, (glyph, offset) in enumerate(zip(glyphs, offsets)):
+            glyph_family = glyph.get_family()
+            old_char = old_chars[i] if i < len(old_chars) else None
+            if old_char is not None and type(old_char) is type(glyph) and \
+                    len(old_char.get_family()) == len(glyph_family):
+                for old_mob, glyph_mob in zip(old_char.get_family(), glyph_family):
+                    old_mob.points = scale_factor * glyph_mob.points + offset
+                if hasattr(glyph, "tex_string"):
+                    old_char.tex_string = glyph.tex_string
+                new_chars.append(old_char)
+            else:
+                new_char = glyph.copy()
+                for mob in new_char.get_family():
+                    mob.points = scale_factor * mob.points + offset
+                new_char.match_style(old_chars[min(i, len(old_chars) - 1)])
+                new_chars.append(new_char)
+        background_rectangle = getattr(self, "background_rectangle", None)
+        self.submobjects = new_chars
+        if settings["unit"] is not None:
+            self.unit_sign = new_chars[-1]
+        if settings["include_background_rectangle"]:
+            self.add_background_rectangle()
+            if background_rectangle is not None:
+                # Keep the old rectangle, and its style, around
+                # the new characters
+                background_rectangle.points = self.background_rectangle.points
+                self.submobjects[0] = background_rectangle
+                self.background_rectangle = background_rectangle
+
+        new_family = self.get_family()
         for mob in old_family:
-            # Dumb hack...due to how scene handles families
-            # of animated mobjects
-            mob.points[:] = 0
+            if mob not in new_family:
+                # Dumb hack...due to how scene handles families
+                # of animated mobjects
+                mob.points[:] = 0
+                mob.note_changed_points()
         self.number = number
         return self
 
+    def get_box_point(self, box, direction):
+        # As get_critical_point does, for a bounding box
+        return np.where(
+            direction < 0, box[0],
+            np.where(direction > 0, box[1], box.mean(axis=0))
+        )
+
     def get_value(self):
         return self.number
 
@@ -1,6 +1,9 @@
+import hashlib
 import itertools as it
+import pickle
 import re
 import string
+import tempfile
 import warnings
 
 from xml.dom import minidom
@@ -25,6 +28,81 @@ def get_style(element):
             sdict[s[0].strip()] = s[1].strip()
     return sdict
 
+# Parsed svg files, keyed by SVGMobject.get_parsed_svg_key, as
+# trees of path strings, fill colors and point arrays
+parsed_svg_cache = dict()
+# Content hashes of svg files, keyed by path, modification
+# time and size, so that unchanged files are not read again
+svg_file_hashes = dict()
+
+
+def get_svg_file_hash(file_path):
+    stat = os.stat(file_path)
+    key = (file_path, stat.st_mtime_ns, stat.st_size)
+    if key not in svg_file_hashes:
+        with open(file_path, "rb") as svg_file:
+            svg_file_hashes[key] = hashlib.sha256(svg_file.read()).hexdigest()
+    return svg_file_hashes[key]
+
+
+def get_parsed_svg(key):
+    if key not in parsed_svg_cache:
+        cache_file = os.path.join(SVG_CACHE_DIR, key + ".pkl")
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, "rb") as fp:
+                parsed_svg_cache[key] = pickle.load(fp)
+        except Exception:
+            return None
+    return parsed_svg_cache[key]
+
+
+def cache_parsed_svg(key, parsed_svg):
+    parsed_svg_cache[key] = parsed_svg
+    fd, temp_file = tempfile.mkstemp(dir=SVG_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            pickle.dump(parsed_svg, fp)
+        os.replace(temp_file, os.path.join(SVG_CACHE_DIR, key + ".pkl"))
+    except Exception:
+        # The in-memory cache still holds it
+        os.remove(temp_file)
+
+
+def mobject_to_parsed_svg(mobject):
+    """
+    Describes a mobject produced by parsing an svg, or returns None
+    if it is not made purely of groups and path strings
+    """
+    if isinstance(mobject, VMobjectFromSVGPathstring):
+        return (
+            "path",
+            mobject.__class__,
+            mobject.path_string,
+            mobject.fill_color,
+            np.array(mobject.points),
+        )
+    if mobject.__class__ is VGroup:
+        children = list(map(mobject_to_parsed_svg, mobject.submobjects))
+        if None in children:
+            return None
+        return ("group", children)
+    return None
+
+
+def parsed_svg_to_mobject(parsed_svg):
+    if parsed_svg[0] == "path":
+        Class, path_string, fill_color, points = parsed_svg[1:]
+        return Class(
+            path_string,
+            fill_color=fill_color,
+            fill_opacity=1.0,
+            cached_points=points,
+        )
+    return VGroup(*map(parsed_svg_to_mobject, parsed_svg[1]))
+
+
 def string_to_numbers(num_string):
     num_string = num_string.replace("-", ",-")
     num_string = num_string.replace("e,-", "e-")
@@ -81,6 +159,13 @@ class SVGMobject(VMobject):
         return fill_color
 
     def generate_points(self):
+        key = self.get_parsed_svg_key()
+        if key is not None:
+            parsed_svg = get_parsed_svg(key)
+            if parsed_svg is not None:
+                self.add(*map(parsed_svg_to_mobject, parsed_svg))
+                return
+
         doc = minidom.parse(self.file_path)
         self.ref_to_element = {}
         for svg in doc.getElementsByTagName("svg"):
@@ -91,6 +176,38 @@ class SVGMobject(VMobject):
                 self.add(*mobjects[0].submobjects)
         doc.unlink()
 
+        if key is not None:
+            parsed_svg = list(map(mobject_to_parsed_svg, self.submobjects))
+            if None not in parsed_svg:
+                cache_parsed_svg(key, parsed_svg)
+
+    def get_parsed_svg_key(self):
+        """
+        Returns the key under which the parsed form of this
+        file is cached, or None if it shouldn't be cached
+        """
+        parsing_methods = [
+            "get_mobjects_from",
+            "path_to_mobject",
+            "use_to_mobjects",
+            "get_fill_color",
+            "handle_transforms",
+        ]
+        # Subclasses which parse differently would have to
+        # describe their own results
+        for method in parsing_methods:
+            if getattr(self.__class__, method) is not getattr(SVGMobject, method):
+                return None
+        hasher = hashlib.sha256()
+        hasher.update(get_svg_file_hash(self.file_path).encode())
+        hasher.update(repr((
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            self.unpack_groups,
+            str(self.fill_color),
+        )).encode())
+        return hasher.hexdigest()[:32]
+
     def get_mobjects_from(self, element):
         result = []
         if not isinstance(element, minidom.Element):
@@ -324,7 +441,9 @@ class SVGMobject(VMobject):
 
 
 class VMobjectFromSVGPathstring(VMobject):
-    def __init__(self, path_string, **kwargs):
+    CONFIG_AS_CLASS_DEFAULTS = True
+
+    def __init__(self, path_string, cached_points=None, **kwargs):
         digest_locals(self)
         VMobject.__init__(self, **kwargs)
 
@@ -345,6 +464,11 @@ class VMobjectFromSVGPathstring(VMobject):
         return result
 
     def generate_points(self):
+        if self.cached_points is not None:
+            # Points from parsing this same path string before
+            self.points = np.array(self.cached_points)
+            self.cached_points = None
+            return
         pattern = "[%s]" % ("".join(self.get_path_commands()))
         pairs = list(zip(
             re.findall(pattern, self.path_string),
@@ -1,4 +1,6 @@
 from functools import reduce
+import ast
+import inspect
 import operator as op
 
 from manimlib.constants import *
@@ -10,6 +12,8 @@ from manimlib.mobject.types.vectorized_mobject import VectorizedPoint
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.strings import split_string_list_to_isolate_substrings
 from manimlib.utils.tex_file_writing import tex_to_svg_file
+from manimlib.utils.tex_file_writing import tex_to_svg_files
+from manimlib.utils.tex_file_writing import compile_tex_in_background
 
 
 TEX_MOB_SCALE_FACTOR = 0.05
@@ -19,7 +23,8 @@ class TexSymbol(VMobjectFromSVGPathstring):
     """
     Purely a renaming of VMobjectFromSVGPathstring
     """
-    pass
+    # Made for every glyph of every tex mobject
+    CONFIG_AS_CLASS_DEFAULTS = True
 
 
 class SingleStringTexMobject(SVGMobject):
@@ -50,6 +55,21 @@ class SingleStringTexMobject(SVGMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    @classmethod
+    def get_modified_expressions(cls, tex_strings, **kwargs):
+        """
+        Returns the expressions which instances of this class, built
+        from each of tex_strings with the given kwargs, would compile,
+        along with the template they would use
+        """
+        mob = cls.__new__(cls)
+        digest_config(mob, kwargs)
+        expressions = [
+            mob.get_modified_expression(tex_string)
+            for tex_string in tex_strings
+        ]
+        return expressions, mob.template_tex_file_body
+
     def get_modified_expression(self, tex_string):
         result = self.alignment + " " + tex_string
         result = result.strip()
@@ -140,6 +160,7 @@ class TexMobject(SingleStringTexMobject):
         digest_config(self, kwargs)
         tex_strings = self.break_up_tex_strings(tex_strings)
         self.tex_strings = tex_strings
+        self.compile_tex_strings()
         SingleStringTexMobject.__init__(
             self, self.arg_separator.join(tex_strings), **kwargs
         )
@@ -161,6 +182,27 @@ class TexMobject(SingleStringTexMobject):
         split_list = [s for s in split_list if s != '']
         return split_list
 
+    def compile_tex_strings(self):
+        # break_up_by_substrings builds a SingleStringTexMobject for
+        # each part, so those start compiling alongside the full string
+        for template, expressions in self.get_expressions_to_compile().items():
+            compile_tex_in_background(expressions, template)
+
+    def get_expressions_to_compile(self):
+        """
+        Returns a dict mapping each template used in building
+        this TexMobject to the expressions compiled with it
+        """
+        part_expressions, part_template = SingleStringTexMobject.get_modified_expressions(
+            self.tex_strings, **self.CONFIG
+        )
+        full_expression = self.get_modified_expression(
+            self.arg_separator.join(self.tex_strings)
+        )
+        result = {part_template: part_expressions}
+        result.setdefault(self.template_tex_file_body, []).append(full_expression)
+        return result
+
     def break_up_by_substrings(self):
         """
         Reorganize existing submojects one layer
@@ -317,3 +359,55 @@ class Title(TextMobject):
                 underline.set_width(self.underline_width)
             self.add(underline)
             self.underline = underline
+
+
+def compile_tex_in_module(module):
+    """
+    Looks through the source of a module for tex mobjects built only
+    from literals, and starts compiling all of their expressions in
+    the background, so that they are ready by the time a scene's
+    construct method asks for them
+    """
+    try:
+        tree = ast.parse(inspect.getsource(module))
+    except (OSError, TypeError, SyntaxError):
+        return
+    expressions_by_template = dict()
+    for node in ast.walk(tree):
+        try:
+            groups = get_expressions_to_compile_from_call(node, vars(module))
+        except Exception:
+            continue
+        for template, expressions in groups.items():
+            expressions_by_template.setdefault(template, []).extend(expressions)
+    for template, expressions in expressions_by_template.items():
+        compile_tex_in_background(expressions, template)
+
+
+def get_expressions_to_compile_from_call(node, namespace):
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        return dict()
+    Class = namespace.get(node.func.id)
+    if not isinstance(Class, type) or not issubclass(Class, SingleStringTexMobject):
+        return dict()
+    if Class.__init__ not in [SingleStringTexMobject.__init__, TexMobject.__init__]:
+        # Subclasses with their own arguments can't be predicted
+        return dict()
+    tex_strings = [ast.literal_eval(arg) for arg in node.args]
+    kwargs = dict()
+    for keyword in node.keywords:
+        if keyword.arg == "tex_to_color_map" and isinstance(keyword.value, ast.Dict):
+            # Only the keys, not the colors, affect what gets compiled
+            kwargs[keyword.arg] = dict.fromkeys(map(ast.literal_eval, keyword.value.keys))
+        else:
+            kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+    if not all([isinstance(tex_string, str) for tex_string in tex_strings]):
+        return dict()
+
+    if issubclass(Class, TexMobject):
+        mob = Class.__new__(Class)
+        digest_config(mob, kwargs)
+        mob.tex_strings = mob.break_up_tex_strings(tex_strings)
+        return mob.get_expressions_to_compile()
+    expressions, template = Class.get_modified_expressions(tex_strings, **kwargs)
+    return {template: expressions}
@@ -39,8 +39,10 @@ class AbstractImageMobject(Mobject):
         self.stretch_to_fit_height(self.height)
         self.stretch_to_fit_width(self.height * w / h)
 
-    def copy(self):
-        return self.deepcopy()
+    def get_display_points(self):
+        # The fourth corner, which only matters once rotated
+        ul, ur, dl = self.points[:3]
+        return np.vstack([self.points, ur + dl - ul])
 
 
 class ImageMobject(AbstractImageMobject):
@@ -0,0 +1,342 @@
+from manimlib.constants import *
+from manimlib.mobject.mobject import Mobject
+from manimlib.utils.bezier import interpolate
+from manimlib.utils.color import DEFAULT_COLORMAP
+from manimlib.utils.color import color_to_rgba
+from manimlib.utils.color import rgba_to_color
+from manimlib.utils.color import values_to_rgbas
+from manimlib.utils.color import values_to_rgbs
+from manimlib.utils.mesh_files import open_mesh_file
+
+
+class TriangleMesh(Mobject):
+    """
+    A set of triangles sharing a common array of vertices, as in
+    a finite element mesh.  The vertices are stored as the points
+    of the mobject, and cells is an array with one row for each
+    triangle, holding the indices of its three vertices.
+
+    The fill can be a single color, one color for each cell, or
+    one color for each vertex, which is then blended across each
+    triangle.  The camera draws all the cells of a mesh together,
+    rather than as separate paths.
+    """
+    CONFIG = {
+        # Defaults to the color of the mobject
+        "fill_color": None,
+        "fill_opacity": 1.0,
+        "stroke_color": WHITE,
+        "stroke_width": 0,
+        "stroke_opacity": 1.0,
+    }
+
+    def __init__(self, vertices, cells, **kwargs):
+        self.cells = np.array(cells, dtype=int).reshape((-1, 3))
+        Mobject.__init__(self, **kwargs)
+        self.set_vertices(vertices)
+
+    def init_colors(self):
+        self.cell_rgbas = np.repeat(
+            [color_to_rgba(self.fill_color or self.color, self.fill_opacity)],
+            len(self.cells), axis=0
+        )
+        self.vertex_rgbas = np.zeros((0, 4))
+        self.stroke_rgba = color_to_rgba(
+            self.stroke_color, self.stroke_opacity
+        )
+        return self
+
+    # Vertices and cells
+    def set_vertices(self, vertices):
+        """
+        Replaces the positions of the vertices, e.g. from
+        an updater, keeping the cells and colors as they are.
+        Vertices may be given in two or three dimensions.
+        """
+        vertices = np.array(vertices, dtype=float)
+        points = np.zeros((len(vertices), self.dim))
+        points[:, :vertices.shape[1]] = vertices[:, :self.dim]
+        self.points = points
+        return self
+
+    def get_vertices(self):
+        return self.points
+
+    def get_cells(self):
+        return self.cells
+
+    def get_num_cells(self):
+        return len(self.cells)
+
+    def get_triangles(self):
+        """
+        Returns an array of shape (num_cells, 3, dim) with
+        the corners of each triangle
+        """
+        return self.points[self.cells]
+
+    # Colors
+    def set_color(self, color=YELLOW_C, family=True):
+        self.set_fill(color, family=family)
+        self.color = color
+        return self
+
+    def set_fill(self, color=None, opacity=None, family=True):
+        if color is not None:
+            self.cell_rgbas[:, :3] = color_to_rgba(color)[:3]
+            self.vertex_rgbas = np.zeros((0, 4))
+        if opacity is not None:
+            self.cell_rgbas[:, 3] = opacity
+            self.vertex_rgbas[:, 3] = opacity
+        if family:
+            for submob in self.submobjects:
+                if hasattr(submob, "set_fill"):
+                    submob.set_fill(color, opacity, family)
+        return self
+
+    def set_stroke(self, color=None, width=None, opacity=None, family=True):
+        if color is not None:
+            self.stroke_rgba[:3] = color_to_rgba(color)[:3]
+        if opacity is not None:
+            self.stroke_rgba[3] = opacity
+        if width is not None:
+            self.stroke_width = width
+        if family:
+            for submob in self.submobjects:
+                if hasattr(submob, "set_stroke"):
+                    submob.set_stroke(color, width, opacity, family=family)
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        self.set_fill(opacity=opacity, family=family)
+        self.set_stroke(opacity=opacity, family=family)
+        return self
+
+    def fade(self, darkness=0.5, family=True):
+        factor = 1.0 - darkness
+        self.cell_rgbas[:, 3] *= factor
+        self.vertex_rgbas[:, 3] *= factor
+        self.stroke_rgba[3] *= factor
+        super().fade(darkness, family)
+        return self
+
+    def set_cell_colors(self, colors, opacity=None):
+        """
+        colors is either a list with a color for each cell,
+        or an array of rgb or rgba values with a row for each
+        """
+        self.cell_rgbas = self.colors_to_rgbas(
+            colors, len(self.cells), opacity
+        )
+        self.vertex_rgbas = np.zeros((0, 4))
+        return self
+
+    def set_vertex_colors(self, colors, opacity=None):
+        """
+        colors is either a list with a color for each vertex,
+        or an array of rgb or rgba values with a row for each
+        """
+        self.vertex_rgbas = self.colors_to_rgbas(
+            colors, len(self.points), opacity
+        )
+        return self
+
+    def set_colors_by_scalar_field(self, values, colormap=DEFAULT_COLORMAP,
+                                   min_value=None, max_value=None):
+        """
+        Colors the mesh by values, looked up in colormap, with
+        either one value for each vertex, which are blended across
+        each triangle, or one for each cell.  Pass min_value and
+        max_value to keep the same scale from one frame of an
+        animation to the next.
+        """
+        if len(values) == len(self.points):
+            array_name = "vertex_rgbas"
+        elif len(values) == len(self.cells):
+            array_name = "cell_rgbas"
+            self.vertex_rgbas = np.zeros((0, 4))
+        else:
+            raise Exception(
+                "Expected {} or {} values, got {}".format(
+                    len(self.points), len(self.cells), len(values)
+                )
+            )
+        rgbas = getattr(self, array_name)
+        if len(rgbas) == len(values):
+            rgbas[:, :3] = values_to_rgbs(
+                values, colormap, min_value, max_value
+            )
+        else:
+            opacity = self.cell_rgbas[0, 3] if len(self.cell_rgbas) else 1
+            setattr(self, array_name, values_to_rgbas(
+                values, colormap, min_value, max_value, opacity
+            ))
+        return self
+
+    def colors_to_rgbas(self, colors, length, opacity=None):
+        if isinstance(colors, np.ndarray) and colors.dtype != object:
+            rgbas = np.ones((len(colors), 4))
+            rgbas[:, 3] = self.fill_opacity
+            rgbas[:, :colors.shape[1]] = colors
+        else:
+            rgbas = np.array([
+                color_to_rgba(color, self.fill_opacity)
+                for color in colors
+            ])
+        if len(rgbas) != length:
+            raise Exception(
+                "Expected {} colors, got {}".format(length, len(rgbas))
+            )
+        if opacity is not None:
+            rgbas[:, 3] = opacity
+        return rgbas
+
+    def get_cell_rgbas(self):
+        return self.cell_rgbas
+
+    def get_vertex_rgbas(self):
+        return self.vertex_rgbas
+
+    def has_vertex_colors(self):
+        return len(self.vertex_rgbas) > 0
+
+    def get_stroke_rgba(self):
+        return self.stroke_rgba
+
+    def get_stroke_width(self):
+        return self.stroke_width
+
+    def get_color(self):
+        if self.has_vertex_colors():
+            return rgba_to_color(self.vertex_rgbas[0])
+        if len(self.cell_rgbas) > 0:
+            return rgba_to_color(self.cell_rgbas[0])
+        return self.color
+
+    # Animation
+    def align_points(self, mobject):
+        """
+        Pads whichever of self and mobject has fewer vertices, or
+        fewer cells, so that the two can be interpolated.  Extra
+        vertices copy existing ones, and extra cells are degenerate
+        triangles, which draw nothing.  Cells themselves can't be
+        interpolated, so those of the target are taken on halfway
+        through, see interpolate_color.
+        """
+        if not isinstance(mobject, TriangleMesh):
+            raise Exception(
+                "A TriangleMesh can only be aligned with another "
+                "TriangleMesh, not a {}".format(type(mobject).__name__)
+            )
+        num_vertices = max(len(self.points), len(mobject.points))
+        num_cells = max(len(self.cells), len(mobject.cells))
+        for mesh in self, mobject:
+            mesh.pad_vertices(num_vertices)
+            mesh.pad_cells(num_cells)
+        return self
+
+    def pad_vertices(self, num_vertices):
+        num_new = num_vertices - len(self.points)
+        if num_new <= 0:
+            return self
+        if len(self.points) == 0:
+            self.points = np.zeros((num_new, self.dim))
+            return self
+        # Spread the copies over the existing vertices
+        indices = np.linspace(
+            0, len(self.points) - 1, num_new
+        ).astype(int)
+        self.points = np.vstack([self.points, self.points[indices]])
+        if self.has_vertex_colors():
+            self.vertex_rgbas = np.vstack([
+                self.vertex_rgbas, self.vertex_rgbas[indices]
+            ])
+        return self
+
+    def pad_cells(self, num_cells):
+        num_new = num_cells - len(self.cells)
+        if num_new <= 0:
+            return self
+        self.cells = np.vstack([
+            self.cells, np.zeros((num_new, 3), dtype=int)
+        ])
+        if len(self.cell_rgbas) > 0:
+            new_rgbas = self.cell_rgbas[[-1] * num_new]
+        else:
+            new_rgbas = np.zeros((num_new, 4))
+        self.cell_rgbas = np.vstack([self.cell_rgbas, new_rgbas])
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        self.cells = mobject2.cells if alpha > 0.5 else mobject1.cells
+        for attr in ["cell_rgbas", "vertex_rgbas", "stroke_rgba"]:
+            array1 = getattr(mobject1, attr)
+            array2 = getattr(mobject2, attr)
+            if array1.shape == array2.shape:
+                setattr(self, attr, interpolate(array1, array2, alpha))
+            else:
+                setattr(self, attr, np.array(
+                    array2 if alpha > 0.5 else array1
+                ))
+        self.stroke_width = interpolate(
+            mobject1.stroke_width, mobject2.stroke_width, alpha
+        )
+
+    def pointwise_become_partial(self, mobject, a, b):
+        """
+        Keeps only the cells from proportion a to proportion
+        b of the cells of mobject
+        """
+        lower_index, upper_index = [
+            int(x * mobject.get_num_cells())
+            for x in (a, b)
+        ]
+        self.points = np.array(mobject.points)
+        self.cells = np.array(mobject.cells[lower_index:upper_index])
+        self.cell_rgbas = np.array(mobject.cell_rgbas[lower_index:upper_index])
+        self.vertex_rgbas = np.array(mobject.vertex_rgbas)
+        return self
+
+
+class TriangleMeshFromFile(TriangleMesh):
+    """
+    A TriangleMesh read from a Gmsh .msh or .geo file, or an XDMF
+    file.  Nodal fields stored in the file are read one time step
+    at a time, with get_field.
+    """
+
+    def __init__(self, file_name, **kwargs):
+        self.file_name = file_name
+        mesh_file = self.get_mesh_file()
+        TriangleMesh.__init__(
+            self, mesh_file.points, mesh_file.cells, **kwargs
+        )
+
+    def get_mesh_file(self):
+        return open_mesh_file(self.file_name)
+
+    def get_field_names(self):
+        return self.get_mesh_file().get_field_names()
+
+    def get_num_time_steps(self, field_name):
+        return self.get_mesh_file().get_num_time_steps(field_name)
+
+    def get_times(self, field_name):
+        return self.get_mesh_file().get_times(field_name)
+
+    def get_field(self, field_name, time_step=0):
+        return self.get_mesh_file().get_field(field_name, time_step)
+
+    def set_colors_by_field(self, field_name, time_step=0,
+                            colormap=DEFAULT_COLORMAP,
+                            min_value=None, max_value=None):
+        """
+        Colors the mesh by a nodal field from the file, using
+        the magnitude of fields with several components
+        """
+        values = self.get_field(field_name, time_step)
+        if values.ndim > 1:
+            values = np.linalg.norm(values, axis=1)
+        return self.set_colors_by_scalar_field(
+            values, colormap, min_value, max_value
+        )
@@ -230,6 +230,7 @@ class Point(PMobject):
     CONFIG = {
         "color": BLACK,
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
     def __init__(self, location=ORIGIN, **kwargs):
         PMobject.__init__(self, **kwargs)
@@ -1,5 +1,7 @@
+from collections import OrderedDict
 import itertools as it
 import sys
+import weakref
 
 from colour import Color
 
@@ -7,11 +9,14 @@ from manimlib.constants import *
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.three_d_utils import get_3d_vmob_gradient_start_and_end_points
 from manimlib.utils.bezier import bezier
+from manimlib.utils.bezier import evaluate_bezier_curves
 from manimlib.utils.bezier import get_smooth_handle_points
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.bezier import integer_interpolate
-from manimlib.utils.bezier import partial_bezier_points
+from manimlib.utils.bezier import partial_bezier_curves
+from manimlib.utils.color import DEFAULT_COLORMAP
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.color import values_to_rgbs
 from manimlib.utils.iterables import make_even
 from manimlib.utils.iterables import stretch_array_to_length
 from manimlib.utils.iterables import tuplify
@@ -27,6 +32,38 @@ from manimlib.utils.space_ops import get_norm
 # - Think about length of self.points.  Always 0 or 1 mod 4?
 #   That's kind of weird.
 
+# Results of VMobject.align_points, keyed by the classes and points
+# of the pair being aligned, so that transforming between the same
+# shapes again does not redo the work.  Only the most recently used
+# entries are kept.
+ALIGNED_POINTS_CACHE = OrderedDict()
+ALIGNED_POINTS_CACHE_SIZE = 32
+
+# Results of VMobject.generate_rgbas_array, keyed by the colors,
+# opacities and sheen they were made from, so that building many
+# mobjects in the same style skips the color conversions
+STYLE_RGBAS_CACHE = OrderedDict()
+STYLE_RGBAS_CACHE_SIZE = 256
+
+# Read-only rgba arrays, shared by every VMobject with the same
+# style.  Entries are dropped once no mobject refers to them.
+INTERNED_RGBAS = weakref.WeakValueDictionary()
+
+
+def get_interned_rgbas(rgbas):
+    """
+    Returns a read-only array equal to rgbas, which is the same
+    array for every call with the same values
+    """
+    rgbas = np.asarray(rgbas, dtype=float)
+    key = (rgbas.shape, rgbas.tobytes())
+    result = INTERNED_RGBAS.get(key)
+    if result is None:
+        result = np.array(rgbas)
+        result.flags.writeable = False
+        INTERNED_RGBAS[key] = result
+    return result
+
 
 class VMobject(Mobject):
     CONFIG = {
@@ -61,6 +98,7 @@ class VMobject(Mobject):
         "tolerance_for_point_equality": 1e-6,
         "n_points_per_cubic_curve": 4,
     }
+    CACHE_ATTRS = Mobject.CACHE_ATTRS + ["packed_rgbas"]
 
     def get_group_class(self):
         return VGroup
@@ -94,24 +132,49 @@ class VMobject(Mobject):
         Likewise, opacity can either be a float, or a tuple of floats.
         If self.sheen_factor is not zero, and only
         one color was passed in, a second slightly light color
-        will automatically be added for the gradient
+        will automatically be added for the gradient.
+
+        The result is interned, and so read-only.
         """
         colors = list(tuplify(color))
         opacities = list(tuplify(opacity))
+        sheen_factor = self.get_sheen_factor()
+        key = (
+            tuple(
+                c.get_hsl() if isinstance(c, Color) else c
+                for c in colors
+            ),
+            tuple(opacities),
+            sheen_factor,
+        )
+        if key in STYLE_RGBAS_CACHE:
+            STYLE_RGBAS_CACHE.move_to_end(key)
+            return STYLE_RGBAS_CACHE[key]
+
         rgbas = np.array([
             color_to_rgba(c, o)
             for c, o in zip(*make_even(colors, opacities))
         ])
 
-        sheen_factor = self.get_sheen_factor()
         if sheen_factor != 0 and len(rgbas) == 1:
             light_rgbas = np.array(rgbas)
             light_rgbas[:, :3] += sheen_factor
             clip_in_place(light_rgbas, 0, 1)
             rgbas = np.append(rgbas, light_rgbas, axis=0)
+        rgbas = get_interned_rgbas(rgbas)
+        STYLE_RGBAS_CACHE[key] = rgbas
+        if len(STYLE_RGBAS_CACHE) > STYLE_RGBAS_CACHE_SIZE:
+            STYLE_RGBAS_CACHE.popitem(last=False)
         return rgbas
 
     def update_rgbas_array(self, array_name, color=None, opacity=None):
+        """
+        The rgbas arrays are interned, and so may be shared with
+        other mobjects.  Rather than being changed in place, they
+        are replaced by the interned array for the new style.
+        """
+        if color is None and opacity is None and hasattr(self, array_name):
+            return self
         passed_color = color if (color is not None) else BLACK
         passed_opacity = opacity if (opacity is not None) else 0
         rgbas = self.generate_rgbas_array(passed_color, passed_opacity)
@@ -125,15 +188,19 @@ class VMobject(Mobject):
             curr_rgbas = stretch_array_to_length(
                 curr_rgbas, len(rgbas)
             )
-            setattr(self, array_name, curr_rgbas)
         elif len(rgbas) < len(curr_rgbas):
             rgbas = stretch_array_to_length(rgbas, len(curr_rgbas))
+        if color is not None and opacity is not None:
+            setattr(self, array_name, get_interned_rgbas(rgbas))
+            return self
         # Only update rgb if color was not None, and only
         # update alpha channel if opacity was passed in
-        if color is not None:
-            curr_rgbas[:, :3] = rgbas[:, :3]
-        if opacity is not None:
-            curr_rgbas[:, 3] = rgbas[:, 3]
+        rgbas = np.array(rgbas)
+        if color is None:
+            rgbas[:, :3] = curr_rgbas[:, :3]
+        if opacity is None:
+            rgbas[:, 3] = curr_rgbas[:, 3]
+        setattr(self, array_name, get_interned_rgbas(rgbas))
         return self
 
     def set_fill(self, color=None, opacity=None, family=True):
@@ -349,6 +416,68 @@ class VMobject(Mobject):
             self.set_fill(self.get_fill_color(), family=family)
         return self
 
+    def set_colors_by_scalar_field(self, values, colormap=DEFAULT_COLORMAP,
+                                   min_value=None, max_value=None,
+                                   fill=True, stroke=True):
+        """
+        Colors each submobject, along with its whole family, (or self,
+        if there are none) by the corresponding entry of values, looked
+        up in colormap, keeping their opacities.  Pass min_value and
+        max_value to keep the same scale from one frame of an animation
+        to the next.
+        """
+        submobs = self.submobjects or [self]
+        if len(values) != len(submobs):
+            raise Exception("Expected {} values, got {}".format(
+                len(submobs), len(values)
+            ))
+        families = [submob.get_family() for submob in submobs]
+        mobs = list(it.chain(*families))
+        rgbs = np.repeat(
+            values_to_rgbs(values, colormap, min_value, max_value),
+            list(map(len, families)), axis=0
+        )
+        array_names = []
+        if fill:
+            array_names.append("fill_rgbas")
+        if stroke:
+            array_names.append("stroke_rgbas")
+        for array_name in array_names:
+            packed_rgbas, row_counts = self.get_packed_rgbas(array_name, mobs)
+            if np.all(row_counts == 1):
+                packed_rgbas[:, :3] = rgbs
+            else:
+                packed_rgbas[:, :3] = np.repeat(rgbs, row_counts, axis=0)
+        return self
+
+    def get_packed_rgbas(self, array_name, mobs):
+        """
+        Returns a single array holding the rgbas of array_name for
+        each of mobs, whose own arrays are made views into it, along
+        with the number of rows belonging to each.  This is reused
+        for as long as none of mobs has been given a new array.
+        """
+        if not hasattr(self, "packed_rgbas"):
+            self.packed_rgbas = dict()
+        arrays = [getattr(mob, array_name) for mob in mobs]
+        if array_name in self.packed_rgbas:
+            packed_rgbas, row_counts, views = self.packed_rgbas[array_name]
+            if len(views) == len(arrays) and all(
+                array is view for array, view in zip(arrays, views)
+            ):
+                return packed_rgbas, row_counts
+        row_counts = np.array([len(array) for array in arrays])
+        packed_rgbas = np.concatenate(arrays).astype(float)
+        views = []
+        start = 0
+        for mob, count in zip(mobs, row_counts):
+            view = packed_rgbas[start:start + count]
+            setattr(mob, array_name, view)
+            views.append(view)
+            start += count
+        self.packed_rgbas[array_name] = (packed_rgbas, row_counts, views)
+        return packed_rgbas, row_counts
+
     def get_sheen_direction(self):
         return np.array(self.sheen_direction)
 
@@ -382,6 +511,27 @@ class VMobject(Mobject):
         self.color_using_background_image(vmobject.get_background_image_file())
         return self
 
+    def get_render_stamp(self):
+        rgbas = [
+            self.fill_rgbas,
+            self.stroke_rgbas,
+            self.background_stroke_rgbas,
+        ]
+        # Only interned rgbas are sure not to be written into, unlike
+        # those in the middle of an animation, or packed together
+        if any(array.flags.writeable for array in rgbas):
+            return None
+        stamp = (
+            self, self.points_version, *rgbas,
+            self.stroke_width, self.background_stroke_width,
+            self.sheen_factor, self.sheen_direction,
+            self.background_image_file, self.shade_in_3d,
+        )
+        if any(len(array) > 1 for array in rgbas):
+            # Gradients are laid out across the bounding box
+            stamp += (self.get_bounding_box(),)
+        return stamp
+
     def set_shade_in_3d(self, value=True, z_index_as_group=False):
         for submob in self.get_family():
             submob.shade_in_3d = value
@@ -401,10 +551,11 @@ class VMobject(Mobject):
         assert(len(anchors1) == len(handles1) == len(handles2) == len(anchors2))
         nppcc = self.n_points_per_cubic_curve  # 4
         total_len = nppcc * len(anchors1)
-        self.points = np.zeros((total_len, self.dim))
+        points = np.zeros((total_len, self.dim))
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
-            self.points[index::nppcc] = array
+            points[index::nppcc] = array
+        self.points = points
         return self
 
     def clear_points(self):
@@ -588,15 +739,25 @@ class VMobject(Mobject):
             atol=self.tolerance_for_point_equality
         )
 
+    def consider_points_equals_pointwise(self, p0, p1):
+        """
+        Like consider_points_equals, but compares each point
+        in the array p0 with the corresponding point in p1,
+        returning an array of booleans
+        """
+        return np.all(np.isclose(
+            p0, p1,
+            atol=self.tolerance_for_point_equality
+        ), axis=-1)
+
     # Information about line
     def get_cubic_bezier_tuples_from_points(self, points):
         nppcc = VMobject.CONFIG["n_points_per_cubic_curve"]
-        remainder = len(points) % nppcc
-        points = points[:len(points) - remainder]
-        return np.array([
-            points[i:i + nppcc]
-            for i in range(0, len(points), nppcc)
-        ])
+        points = np.array(points)
+        num_curves = len(points) // nppcc
+        return points[:num_curves * nppcc].reshape(
+            (num_curves, nppcc) + points.shape[1:]
+        )
 
     def get_cubic_bezier_tuples(self):
         return self.get_cubic_bezier_tuples_from_points(
@@ -604,20 +765,34 @@ class VMobject(Mobject):
         )
 
     def get_subpaths_from_points(self, points):
-        nppcc = self.n_points_per_cubic_curve
-        split_indices = filter(
-            lambda n: not self.consider_points_equals(
-                points[n - 1], points[n]
-            ),
-            range(nppcc, len(points), nppcc)
-        )
-        split_indices = [0] + list(split_indices) + [len(points)]
+        points = np.asarray(points)
         return [
             points[i1:i2]
-            for i1, i2 in zip(split_indices, split_indices[1:])
-            if (i2 - i1) >= nppcc
+            for i1, i2 in zip(*self.get_subpath_bounds_from_points(points))
         ]
 
+    def get_subpath_bounds_from_points(self, points):
+        """
+        Returns arrays of the indices into points at which each
+        subpath starts, and just after which each one ends
+        """
+        nppcc = self.n_points_per_cubic_curve
+        points = np.asarray(points)
+        # A new subpath starts at each curve whose first point
+        # differs from the last point of the curve before it
+        curve_ends = points[nppcc - 1:len(points) - 1:nppcc]
+        curve_starts = points[nppcc::nppcc]
+        breaks = ~self.consider_points_equals_pointwise(
+            curve_ends, curve_starts
+        )
+        split_indices = np.concatenate([
+            [0], nppcc * (np.flatnonzero(breaks) + 1), [len(points)]
+        ]).astype(int)
+        starts = split_indices[:-1]
+        ends = split_indices[1:]
+        long_enough = (ends - starts) >= nppcc
+        return starts[long_enough], ends[long_enough]
+
     def get_subpaths(self):
         return self.get_subpaths_from_points(self.get_points())
 
@@ -634,10 +809,22 @@ class VMobject(Mobject):
         return len(self.points) // nppcc
 
     def point_from_proportion(self, alpha):
+        return self.points_from_proportions([alpha])[0]
+
+    def points_from_proportions(self, alphas):
+        """
+        Like point_from_proportion, but for a whole array
+        of alphas at once
+        """
         num_cubics = self.get_num_curves()
-        n, residue = integer_interpolate(0, num_cubics, alpha)
-        curve = self.get_nth_curve_function(n)
-        return curve(residue)
+        alphas = np.clip(np.array(alphas, dtype=float), 0, 1)
+        # Matches integer_interpolate, with alpha = 1 landing
+        # on the end of the last curve
+        indices = np.minimum((num_cubics * alphas).astype(int), num_cubics - 1)
+        residues = num_cubics * alphas - indices
+        return evaluate_bezier_curves(
+            self.get_cubic_bezier_tuples()[indices], residues
+        )
 
     def get_anchors_and_handles(self):
         """
@@ -660,27 +847,37 @@ class VMobject(Mobject):
         return self.points[nppcc - 1::nppcc]
 
     def get_anchors(self):
-        return np.array(list(it.chain(*zip(
-            self.get_start_anchors(),
-            self.get_end_anchors(),
-        ))))
+        start_anchors = self.get_start_anchors()
+        end_anchors = self.get_end_anchors()
+        n_curves = min(len(start_anchors), len(end_anchors))
+        # Interleave the start and end anchors of each curve
+        anchors = np.zeros((2 * n_curves, self.points.shape[1]))
+        anchors[0::2] = start_anchors[:n_curves]
+        anchors[1::2] = end_anchors[:n_curves]
+        return anchors
 
     def get_points_defining_boundary(self):
-        return np.array(list(it.chain(*[
+        return np.concatenate([
             sm.get_anchors()
             for sm in self.get_family()
-        ])))
+        ])
+
+    def get_bounding_box(self):
+        return self.get_family_box("anchors")
+
+    def get_box_points(self, kind):
+        if kind == "anchors":
+            return self.get_anchors()
+        return Mobject.get_box_points(self, kind)
 
     def get_arc_length(self, n_sample_points=None):
         if n_sample_points is None:
             n_sample_points = 4 * self.get_num_curves() + 1
-        points = np.array([
-            self.point_from_proportion(a)
-            for a in np.linspace(0, 1, n_sample_points)
-        ])
+        points = self.points_from_proportions(
+            np.linspace(0, 1, n_sample_points)
+        )
         diffs = points[1:] - points[:-1]
-        norms = np.apply_along_axis(get_norm, 1, diffs)
-        return np.sum(norms)
+        return np.sum(np.linalg.norm(diffs, axis=1))
 
     # Alignment
     def align_points(self, vmobject):
@@ -698,34 +895,74 @@ class VMobject(Mobject):
             if mob.has_new_path_started():
                 mob.add_line_to(mob.get_last_point())
 
+        key = (
+            type(self), self.points.shape, self.points.tobytes(),
+            type(vmobject), vmobject.points.shape, vmobject.points.tobytes(),
+        )
+        if key in ALIGNED_POINTS_CACHE:
+            ALIGNED_POINTS_CACHE.move_to_end(key)
+        else:
+            ALIGNED_POINTS_CACHE[key] = self.get_aligned_points(vmobject)
+            if len(ALIGNED_POINTS_CACHE) > ALIGNED_POINTS_CACHE_SIZE:
+                ALIGNED_POINTS_CACHE.popitem(last=False)
+        new_path1, new_path2 = ALIGNED_POINTS_CACHE[key]
+        self.set_points(new_path1)
+        vmobject.set_points(new_path2)
+        return self
+
+    def get_aligned_points(self, vmobject):
+        """
+        Returns new points for self and for vmobject, with
+        the same number of subpaths and of curves in each
+        """
+        nppcc = self.n_points_per_cubic_curve
+
         # Figure out what the subpaths are, and align
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
-
-        nppcc = self.n_points_per_cubic_curve
 
         def get_nth_subpath(path_list, n):
             if n >= len(path_list):
                 # Create a null path at the very end
-                return [path_list[-1][-1]] * nppcc
+                return np.repeat(path_list[-1][-1:], nppcc, axis=0)
             return path_list[n]
 
-        for n in range(n_subpaths):
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
-            diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
-        return self
+        pairs = [
+            (get_nth_subpath(subpaths1, n), get_nth_subpath(subpaths2, n))
+            for n in range(n_subpaths)
+        ]
+        # Both new paths get as many curves in each subpath
+        # as the longer of the two
+        n_curves = [
+            max(len(sp1), len(sp2)) // nppcc
+            for sp1, sp2 in pairs
+        ]
+
+        def get_new_path(subpaths):
+            # Rather than subdividing subpath by subpath, the portions
+            # of every curve which make up the new path are gathered
+            # and then computed together
+            quads, starts, ends = [], [], []
+            for subpath, n in zip(subpaths, n_curves):
+                sp_quads = self.get_cubic_bezier_tuples_from_points(subpath)
+                indices, sp_starts, sp_ends = self.get_inserted_curve_portions(
+                    len(sp_quads), n - len(sp_quads)
+                )
+                quads.append(sp_quads[indices])
+                starts.append(sp_starts)
+                ends.append(sp_ends)
+            new_quads = partial_bezier_curves(
+                np.concatenate(quads),
+                np.concatenate(starts),
+                np.concatenate(ends),
+            )
+            return new_quads.reshape((-1, self.dim))
+
+        return (
+            get_new_path([sp1 for sp1, sp2 in pairs]),
+            get_new_path([sp2 for sp1, sp2 in pairs]),
+        )
 
     def insert_n_curves(self, n):
         new_path_point = None
@@ -746,7 +983,21 @@ class VMobject(Mobject):
             nppcc = self.n_points_per_cubic_curve
             return np.repeat(points, nppcc * n, 0)
         bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
-        curr_num = len(bezier_quads)
+        if len(bezier_quads) == 0:
+            return np.zeros((0, self.dim))
+        indices, starts, ends = self.get_inserted_curve_portions(
+            len(bezier_quads), n
+        )
+        new_quads = partial_bezier_curves(bezier_quads[indices], starts, ends)
+        return new_quads.reshape((-1, bezier_quads.shape[-1]))
+
+    def get_inserted_curve_portions(self, curr_num, n):
+        """
+        Describes how curr_num curves become curr_num + n, as
+        arrays of indices, starts and ends such that the new kth
+        curve is the portion [starts[k], ends[k]] of the
+        curve numbered indices[k]
+        """
         target_num = curr_num + n
         # This is an array with values ranging from 0
         # up to curr_num,  with repeats such that
@@ -759,23 +1010,19 @@ class VMobject(Mobject):
         # that the nth curve of our path should be split
         # into k pieces.  In the above example, this would
         # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [
-            sum(repeat_indices == i)
-            for i in range(curr_num)
-        ]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points,
-                    partial_bezier_points(quad, a1, a2),
-                    axis=0
-                )
-        return new_points
+        split_factors = np.bincount(repeat_indices, minlength=curr_num)
+        # What was once a single cubic curve will now be broken
+        # into split_factors[i] smaller cubic curves, the kth of
+        # which covers the proportions k / split_factors[i] to
+        # (k + 1) / split_factors[i] of the original
+        piece_starts = np.cumsum(split_factors) - split_factors
+        piece_indices = np.arange(target_num) - piece_starts[repeat_indices]
+        piece_counts = split_factors[repeat_indices]
+        return (
+            repeat_indices,
+            piece_indices / piece_counts,
+            (piece_indices + 1) / piece_counts,
+        )
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
@@ -784,10 +1031,10 @@ class VMobject(Mobject):
             a2 = getattr(vmobject, attr)
             if len(a1) > len(a2):
                 new_a2 = stretch_array_to_length(a2, len(a1))
-                setattr(vmobject, attr, new_a2)
+                setattr(vmobject, attr, get_interned_rgbas(new_a2))
             elif len(a2) > len(a1):
                 new_a1 = stretch_array_to_length(a1, len(a2))
-                setattr(self, attr, new_a1)
+                setattr(self, attr, get_interned_rgbas(new_a1))
         return self
 
     def get_point_mobject(self, center=None):
@@ -828,24 +1075,23 @@ class VMobject(Mobject):
         bezier_quads = vmobject.get_cubic_bezier_tuples()
         num_cubics = len(bezier_quads)
 
+        if num_cubics == 0:
+            self.clear_points()
+            return self
+
         lower_index, lower_residue = integer_interpolate(0, num_cubics, a)
         upper_index, upper_residue = integer_interpolate(0, num_cubics, b)
 
-        self.clear_points()
-        if lower_index == upper_index:
-            self.append_points(partial_bezier_points(
-                bezier_quads[lower_index],
-                lower_residue, upper_residue
-            ))
-        else:
-            self.append_points(partial_bezier_points(
-                bezier_quads[lower_index], lower_residue, 1
-            ))
-            for quad in bezier_quads[lower_index + 1:upper_index]:
-                self.append_points(quad)
-            self.append_points(partial_bezier_points(
-                bezier_quads[upper_index], 0, upper_residue
-            ))
+        # Every curve from lower_index to upper_index is cut down
+        # to its portion [starts[i], ends[i]], which is the whole
+        # curve for all but the first and last of them
+        quads = bezier_quads[lower_index:upper_index + 1]
+        starts = np.zeros(len(quads))
+        ends = np.ones(len(quads))
+        starts[0] = lower_residue
+        ends[-1] = upper_residue
+        new_quads = partial_bezier_curves(quads, starts, ends)
+        self.set_points(new_quads.reshape((-1, bezier_quads.shape[-1])))
         return self
 
     def get_subcurve(self, a, b):
@@ -870,6 +1116,7 @@ class VectorizedPoint(VMobject):
         "artificial_width": 0.01,
         "artificial_height": 0.01,
     }
+    CONFIG_AS_CLASS_DEFAULTS = True
 
     def __init__(self, location=ORIGIN, **kwargs):
         VMobject.__init__(self, **kwargs)
@@ -1,5 +1,8 @@
 import inspect
+import itertools as it
+import multiprocessing as mp
 import random
+import time
 import warnings
 
 from tqdm import tqdm as ProgressDisplay
@@ -11,6 +14,7 @@ from manimlib.animation.transform import MoveToTarget, ApplyMethod
 from manimlib.camera.camera import Camera
 from manimlib.constants import *
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.hashing import get_hash_from_objects
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.svg.tex_mobject import TextMobject
 from manimlib.scene.scene_file_writer import SceneFileWriter
@@ -28,6 +32,16 @@ class Scene(object):
         "start_at_animation_number": None,
         "end_at_animation_number": None,
         "leave_progress_bars": False,
+        # When greater than 1, the frames of animations which are
+        # pure functions of alpha are rendered by this many forked
+        # processes, each handling chunks of frames_per_chunk frames
+        "frame_workers": 1,
+        "frames_per_chunk": 8,
+        # Whether animations and waits which are skipped are stepped
+        # through frame by frame, without drawing, rather than jumped
+        # through in one go.  This is slower, but leaves mobjects with
+        # time-based updaters just as rendering every frame would.
+        "step_through_skipped_animations": False,
     }
 
     def __init__(self, **kwargs):
@@ -42,7 +56,16 @@ class Scene(object):
 
         self.mobjects = []
         self.num_plays = 0
+        # Duration of every play and wait call, indexed like
+        # the partial movie files they produce
+        self.segment_durations = []
         self.time = 0
+        # Wall-clock time spent jumping through skipped animations
+        self.fast_forward_time = 0
+        self.num_fast_forwarded_plays = 0
+        self.segment_is_cached = False
+        # How many play and wait calls reused cached movie files
+        self.num_cached_segments = 0
         if self.random_seed is not None:
             random.seed(self.random_seed)
             np.random.seed(self.random_seed)
@@ -66,6 +89,19 @@ class Scene(object):
 
     def print_end_message(self):
         print("Played {} animations".format(self.num_plays))
+        if self.num_cached_segments > 0:
+            print("Reused cached movie files for {} of them".format(
+                self.num_cached_segments
+            ))
+        if self.skip_animations:
+            self.print_fast_forward_message()
+
+    def print_fast_forward_message(self):
+        if self.num_fast_forwarded_plays > 0:
+            print("Fast-forwarded through {} animations in {:.2f}s".format(
+                self.num_fast_forwarded_plays,
+                self.fast_forward_time,
+            ))
 
     def set_variables_as_attrs(self, *objects, **newly_named_objects):
         """
@@ -163,6 +199,39 @@ class Scene(object):
     def get_mobject_family_members(self):
         return self.camera.extract_mobject_family_members(self.mobjects)
 
+    def get_updated_spatial_index(self):
+        # Indexes those family members which are drawn
+        mobjects = self.camera.extract_mobject_family_members(
+            self.mobjects, only_those_with_points=True
+        )
+        return mobjects, self.camera.spatial_index.update(mobjects)
+
+    def query_region(self, region):
+        """
+        Returns those family members of mobjects in the scene whose
+        points come within region, in the order they are drawn.
+        region is either a mobject, standing for the box around it,
+        or a pair of opposite corners of a box.
+        """
+        if isinstance(region, Mobject):
+            region = region.get_display_bounding_box()
+            if region is None:
+                return []
+        (x0, y0), (x1, y1) = np.array(region)[:, :2]
+        mobjects, spatial_index = self.get_updated_spatial_index()
+        ids = spatial_index.query_region(
+            (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        )
+        return [mob for mob in mobjects if id(mob) in ids]
+
+    def nearest_mobject(self, point):
+        """
+        Returns the family member of mobjects in the scene whose
+        points come nearest to point, or None if there are none
+        """
+        mobjects, spatial_index = self.get_updated_spatial_index()
+        return spatial_index.nearest_mobject(point)
+
     def add(self, *mobjects):
         """
         Mobjects will be displayed, from background to
@@ -266,6 +335,13 @@ class Scene(object):
         )
         return time_progression
 
+    def show_frame_stats(self, time_progression):
+        # How many mobjects the camera culled and drew for the
+        # frame just captured, next to the progress bar
+        time_progression.set_postfix(
+            self.camera.get_frame_stats(), refresh=False
+        )
+
     def get_run_time(self, animations):
         return np.max([animation.run_time for animation in animations])
 
@@ -283,6 +359,7 @@ class Scene(object):
         if self.start_at_animation_number:
             if self.num_plays == self.start_at_animation_number:
                 self.skip_animations = False
+                self.print_fast_forward_message()
         if self.end_at_animation_number:
             if self.num_plays >= self.end_at_animation_number:
                 self.skip_animations = True
@@ -306,8 +383,14 @@ class Scene(object):
         moving_mobjects = self.get_moving_mobjects(*animations)
         self.update_frame(excluded_mobjects=moving_mobjects)
         static_image = self.get_frame()
+        if self.can_render_frames_in_parallel(animations, moving_mobjects):
+            self.render_frames_in_parallel(
+                animations, moving_mobjects, static_image
+            )
+            return
         last_t = 0
-        for t in self.get_animation_time_progression(animations):
+        time_progression = self.get_animation_time_progression(animations)
+        for t in time_progression:
             dt = t - last_t
             last_t = t
             for animation in animations:
@@ -316,40 +399,242 @@ class Scene(object):
                 animation.interpolate(alpha)
             self.update_mobjects(dt)
             self.update_frame(moving_mobjects, static_image)
+            self.show_frame_stats(time_progression)
             self.add_frames(self.get_frame())
 
-    def finish_animations(self, animations):
+    def can_render_frames_in_parallel(self, animations, moving_mobjects):
+        """
+        Frames can only be rendered out of order if each one depends
+        on nothing but alpha, so no time-based updaters may be involved.
+        Worker processes are forked, so that each holds its own copy
+        of the mobjects and the camera.
+        """
+        if self.frame_workers <= 1 or self.skip_animations:
+            return False
+        if "fork" not in mp.get_all_start_methods():
+            return False
+        if self.always_update_mobjects:
+            return False
+        mobjects = self.camera.extract_mobject_family_members(list(it.chain(
+            moving_mobjects,
+            *[animation.get_all_mobjects() for animation in animations]
+        )))
+        return not any([
+            mob.has_time_based_updater()
+            for mob in mobjects
+        ])
+
+    def render_frames_in_parallel(self, animations, moving_mobjects, static_image):
+        """
+        Workers draw chunks of frames straight into shared memory,
+        which holds one more chunk than there are workers, so that
+        frames never have to be pickled back through the pool.
+        Each chunk is only handed out again once its frames have
+        gone to the file writer.
+        """
+        time_progression = self.get_animation_time_progression(animations)
+        times = time_progression.iterable
+        chunk_size = self.frames_per_chunk
+        time_chunks = [
+            times[i:i + chunk_size]
+            for i in range(0, len(times), chunk_size)
+        ]
+        num_slots = self.frame_workers + 1
+        context = mp.get_context("fork")
+        shared_frames = context.RawArray(
+            "B", num_slots * chunk_size * static_image.nbytes
+        )
+        frame_slots = np.frombuffer(
+            shared_frames, dtype=static_image.dtype
+        ).reshape((num_slots, chunk_size, *static_image.shape))
+        state = (
+            self, animations, moving_mobjects, static_image, frame_slots,
+        )
+        # Chunks are taken back in the order they were handed out,
+        # so frames go to the file writer in the order they appear
+        pending = []
+
+        def add_frames_from_next_slot():
+            slot, result = pending.pop(0)
+            num_frames = result.get()
+            for frame in frame_slots[slot, :num_frames]:
+                # The file writer may still hold frames once this
+                # slot is handed out again, so it's given copies
+                self.add_frames(np.array(frame))
+            time_progression.update(num_frames)
+
+        with context.Pool(
+                self.frame_workers,
+                initializer=init_frame_rendering_worker,
+                initargs=state) as pool:
+            for chunk_index, time_chunk in enumerate(time_chunks):
+                if len(pending) == num_slots:
+                    add_frames_from_next_slot()
+                slot = chunk_index % num_slots
+                pending.append((slot, pool.apply_async(
+                    render_frames_at_times, (time_chunk, slot)
+                )))
+            while pending:
+                add_frames_from_next_slot()
+        time_progression.close()
+
+    def render_frames_into(self, frames, times, animations,
+                           moving_mobjects, static_image):
+        for frame, t in zip(frames, times):
+            for animation in animations:
+                animation.update_mobjects(0)
+                animation.interpolate(t / animation.run_time)
+            self.update_mobjects(0)
+            self.update_frame(moving_mobjects, static_image)
+            frame[:] = self.camera.get_pixel_array()
+        return len(times)
+
+    def finish_animations(self, animations, dt=0):
         for animation in animations:
             animation.finish()
             animation.clean_up_from_scene(self)
         self.mobjects_from_last_animation = [
             anim.mobject for anim in animations
         ]
-        if self.skip_animations:
-            # TODO, run this call in for each animation?
-            self.update_mobjects(self.get_run_time(animations))
-        else:
-            self.update_mobjects(0)
+        # TODO, run this call in for each animation?
+        self.update_mobjects(dt)
 
     def play(self, *args):
         # Set up file writer
         self.update_skipping_status()
-        allow_write = not self.skip_animations
-        self.file_writer.begin_animation(self.camera, self.num_plays, allow_write)
+        if len(args) > 0 and not all([isinstance(a, Animation) for a in args]):
+            raise TypeError("All objects must be of type Animation")
+        segment_hash = self.get_segment_hash("play", args)
+        allow_write = self.begin_segment(segment_hash)
 
         if len(args) == 0:
             warnings.warn("Called Scene.play with no animations")
+            self.segment_durations.append(0)
         else:
-            if not all([isinstance(a, Animation) for a in args]):
-                raise TypeError("All objects must be of type Animation")
+            run_time = self.get_run_time(args)
+            self.segment_durations.append(run_time)
+            if self.segment_is_cached:
+                self.step_through_animations(args)
+            elif self.skip_animations:
+                self.fast_forward_animations(args)
+            else:
+                self.begin_animations(args)
+                self.progress_through_animations(args)
+                self.finish_animations(args)
+
+        self.end_segment(allow_write)
+
+    def get_segment_hash(self, *inputs):
+        """
+        Describes everything that determines the frames of the next
+        play or wait call, so that its partial movie file can be
+        reused when none of it has changed.
+        """
+        if self.skip_animations or not self.file_writer.should_cache_segments():
+            return None
+        return get_hash_from_objects(
+            inputs,
+            self.mobjects,
+            self.camera.get_state_for_hashing(),
+            random.getstate(),
+            np.random.get_state(),
+            opaque_types=(Scene, Camera, SceneFileWriter),
+        )
 
-            self.begin_animations(args)
-            self.progress_through_animations(args)
-            self.finish_animations(args)
+    def begin_segment(self, segment_hash):
+        """
+        Returns whether frames should be written for this segment.
+        When a cached movie file is found, the segment is
+        stepped through without drawing any frames, to bring the
+        mobjects into their final state.
+        """
+        self.segment_is_cached = self.file_writer.has_cached_segment(segment_hash)
+        if self.segment_is_cached:
+            self.file_writer.use_cached_segment(segment_hash, self.num_plays)
+            self.skip_animations = True
+            self.num_cached_segments += 1
+        allow_write = not self.skip_animations
+        if allow_write:
+            self.file_writer.begin_animation(
+                self.camera, self.num_plays, allow_write, segment_hash
+            )
+        return allow_write
 
-        self.file_writer.end_animation(allow_write)
+    def end_segment(self, allow_write):
+        if allow_write:
+            self.file_writer.end_animation(allow_write)
+        if self.segment_is_cached:
+            self.skip_animations = False
         self.num_plays += 1
 
+    def get_n_frames(self, duration):
+        dt = 1 / self.camera.frame_rate
+        return len(np.arange(0, duration, dt))
+
+    def fast_forward_animations(self, animations):
+        """
+        Jumps straight to the end of animations which are being
+        skipped, without interpolating through any frames, unless
+        step_through_skipped_animations is set.  Time still advances
+        by as much as rendering them would take.
+        """
+        start_time = time.time()
+        if self.step_through_skipped_animations:
+            self.step_through_animations(animations)
+        else:
+            self.begin_animations(animations)
+            run_time = self.get_run_time(animations)
+            self.finish_animations(animations, dt=run_time)
+            dt = 1 / self.camera.frame_rate
+            self.increment_time(self.get_n_frames(run_time) * dt)
+        self.fast_forward_time += time.time() - start_time
+        self.num_fast_forwarded_plays += 1
+
+    def get_frame_times(self, duration):
+        return np.arange(0, duration, 1 / self.camera.frame_rate)
+
+    def step_through_animations(self, animations):
+        """
+        Steps animations and updaters through every frame, as
+        progress_through_animations does, but without drawing, so
+        that mobjects end up just as rendering would leave them.
+        Used for segments whose movie files are cached, and for
+        skipped ones when step_through_skipped_animations is set,
+        since time-based updaters can depend on the size of each step.
+        """
+        self.begin_animations(animations)
+        dt = 1 / self.camera.frame_rate
+        last_t = 0
+        for t in self.get_frame_times(self.get_run_time(animations)):
+            for animation in animations:
+                animation.update_mobjects(t - last_t)
+                animation.interpolate(t / animation.run_time)
+            self.update_mobjects(t - last_t)
+            self.increment_time(dt)
+            last_t = t
+        self.finish_animations(animations)
+
+    def step_through_wait(self, duration):
+        # As with step_through_animations, updaters
+        # are stepped once per frame
+        dt = 1 / self.camera.frame_rate
+        for t in self.get_frame_times(duration):
+            self.update_mobjects(dt)
+            self.increment_time(dt)
+
+    def fast_forward_wait(self, duration):
+        start_time = time.time()
+        dt = 1 / self.camera.frame_rate
+        if not self.should_update_mobjects():
+            self.increment_time(int(duration / dt) * dt)
+        elif self.step_through_skipped_animations:
+            self.step_through_wait(duration)
+        else:
+            self.update_mobjects(duration)
+            self.increment_time(self.get_n_frames(duration) * dt)
+        self.fast_forward_time += time.time() - start_time
+        self.num_fast_forwarded_plays += 1
+
     def clean_up_animations(self, *animations):
         for animation in animations:
             animation.clean_up_from_scene(self)
@@ -378,20 +663,31 @@ class Scene(object):
         return time_progression
 
     def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None):
-
         self.update_skipping_status()
-        allow_write = not self.skip_animations
-        self.file_writer.begin_animation(self.camera, self.num_plays, allow_write)
+        if stop_condition is None:
+            segment_hash = self.get_segment_hash("wait", duration)
+        else:
+            # How long this runs depends on more than the scene state
+            segment_hash = None
+        allow_write = self.begin_segment(segment_hash)
+        self.segment_durations.append(duration)
 
         dt = 1 / self.camera.frame_rate
         self.update_mobjects(dt=0)  # Any problems with this?
-        if self.should_update_mobjects():
+        if self.segment_is_cached and self.should_update_mobjects():
+            self.step_through_wait(duration)
+        elif self.segment_is_cached:
+            self.increment_time(int(duration / dt) * dt)
+        elif self.skip_animations and stop_condition is None:
+            self.fast_forward_wait(duration)
+        elif self.should_update_mobjects():
             time_progression = self.get_wait_time_progression(duration, stop_condition)
             # TODO, be smart about setting a static image
             # the same way Scene.play does
             for t in time_progression:
                 self.update_mobjects(dt)
                 self.update_frame()
+                self.show_frame_stats(time_progression)
                 self.add_frames(self.get_frame())
                 if stop_condition and stop_condition():
                     time_progression.close()
@@ -402,8 +698,7 @@ class Scene(object):
             frame = self.get_frame()
             self.add_frames(*[frame] * n_frames)
 
-        self.file_writer.end_animation(allow_write)
-        self.num_plays += 1
+        self.end_segment(allow_write)
 
     def wait_until(self, stop_condition, max_time=60):
         self.wait(max_time, stop_condition=stop_condition)
@@ -448,3 +743,22 @@ class Scene(object):
 
 class EndSceneEarlyException(Exception):
     pass
+
+
+# Only ever set in the worker processes of
+# Scene.render_frames_in_parallel, by init_frame_rendering_worker
+_frame_rendering_state = None
+
+
+def init_frame_rendering_worker(*state):
+    global _frame_rendering_state
+    _frame_rendering_state = state
+
+
+def render_frames_at_times(times, slot):
+    scene, animations, moving_mobjects, static_image, frame_slots = \
+        _frame_rendering_state
+    return scene.render_frames_into(
+        frame_slots[slot], times,
+        animations, moving_mobjects, static_image,
+    )
@@ -1,7 +1,10 @@
 import numpy as np
 from pydub import AudioSegment
+import queue
 import shutil
 import subprocess
+import threading
+import time
 import os
 
 from manimlib.constants import FFMPEG_BIN
@@ -10,6 +13,7 @@ from manimlib.utils.config_ops import digest_config
 from manimlib.utils.file_ops import guarantee_existence
 from manimlib.utils.file_ops import add_extension_if_not_present
 from manimlib.utils.file_ops import get_sorted_integer_files
+from manimlib.utils.file_ops import link_or_copy
 from manimlib.utils.sounds import get_full_sound_file_path
 
 
@@ -19,6 +23,13 @@ class SceneFileWriter(object):
         "movie_file_extension": ".mp4",
         "file_name": None,
         "output_directory": None,
+        # Number of frames which may be waiting for the encoder
+        # before write_frame blocks the renderer
+        "frame_queue_size": 16,
+        # Keep a copy of each partial movie file under the hash of
+        # everything that went into it, so that unchanged play and
+        # wait calls need not be rendered again
+        "cache_partial_movies": True,
     }
 
     def __init__(self, camera, **kwargs):
@@ -31,6 +42,8 @@ class SceneFileWriter(object):
         self.init_output_directories(movie_directory)
 
         self.init_audio()
+        # Total time write_frame spent waiting on a full queue
+        self.time_blocked_on_encoder = 0
 
     # Output directories and files
     def init_output_directories(self, movie_directory):
@@ -52,6 +65,10 @@ class SceneFileWriter(object):
                 self.get_partial_movie_directory(),
                 self.file_name,
             ))
+            self.partial_movie_cache_directory = guarantee_existence(os.path.join(
+                movie_dir,
+                self.get_partial_movie_cache_directory(),
+            ))
 
     def get_image_directory(self):
         return "images"
@@ -59,6 +76,9 @@ class SceneFileWriter(object):
     def get_partial_movie_directory(self):
         return "partial_movie_files"
 
+    def get_partial_movie_cache_directory(self):
+        return "cached_partial_movie_files"
+
     # Directory getters
     def get_image_file_path(self):
         return self.image_file_path
@@ -73,6 +93,27 @@ class SceneFileWriter(object):
     def get_movie_file_path(self):
         return self.movie_file_path
 
+    def get_cached_partial_movie_path(self, segment_hash):
+        return os.path.join(
+            self.partial_movie_cache_directory,
+            segment_hash + self.movie_file_extension,
+        )
+
+    # Partial movie cache
+    def should_cache_segments(self):
+        return self.write_to_movie and self.cache_partial_movies
+
+    def has_cached_segment(self, segment_hash):
+        if segment_hash is None or not self.should_cache_segments():
+            return False
+        return os.path.exists(self.get_cached_partial_movie_path(segment_hash))
+
+    def use_cached_segment(self, segment_hash, n):
+        link_or_copy(
+            self.get_cached_partial_movie_path(segment_hash),
+            self.get_next_partial_movie_path(n),
+        )
+
     # Sound
     def init_audio(self):
         self.includes_sound = False
@@ -114,7 +155,8 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, **kwargs)
 
     # Writers
-    def begin_animation(self, camera, n, allow_write=False):
+    def begin_animation(self, camera, n, allow_write=False, segment_hash=None):
+        self.segment_hash = segment_hash
         if self.write_to_movie and allow_write:
             self.open_movie_pipe(camera, n)
 
@@ -124,7 +166,25 @@ class SceneFileWriter(object):
 
     def write_frame(self, frame):
         if self.write_to_movie:
-            self.writing_process.stdin.write(frame.tostring())
+            start_time = time.time()
+            self.frame_queue.put(np.ascontiguousarray(frame))
+            self.time_blocked_on_encoder += time.time() - start_time
+
+    def write_queued_frames(self, frame_queue, writing_process):
+        # Runs on the writer thread.  Frames are handed to ffmpeg
+        # straight from the pixel buffer, without an intermediate
+        # bytes copy.  After a write error the queue is still
+        # drained, so that the renderer never blocks forever.
+        while True:
+            frame = frame_queue.get()
+            if frame is None:
+                return
+            if self.writing_error is not None:
+                continue
+            try:
+                writing_process.stdin.write(frame.data)
+            except Exception as error:
+                self.writing_error = error
 
     def save_image(self, image):
         file_path = self.get_image_file_path()
@@ -136,6 +196,7 @@ class SceneFileWriter(object):
             if hasattr(self, "writing_process"):
                 self.writing_process.terminate()
             self.combine_movie_files(indices)
+            self.print_encoder_wait_message()
 
     def open_movie_pipe(self, camera, n):
         file_path = self.get_next_partial_movie_path(n)
@@ -175,14 +236,33 @@ class SceneFileWriter(object):
 
         command += [temp_file_path]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.writing_error = None
+        self.frame_queue = queue.Queue(maxsize=self.frame_queue_size)
+        self.writing_thread = threading.Thread(
+            target=self.write_queued_frames,
+            args=(self.frame_queue, self.writing_process),
+            daemon=True,
+        )
+        self.writing_thread.start()
 
     def close_movie_pipe(self):
+        start_time = time.time()
+        self.frame_queue.put(None)
+        self.writing_thread.join()
+        self.time_blocked_on_encoder += time.time() - start_time
         self.writing_process.stdin.close()
         self.writing_process.wait()
+        if self.writing_error is not None:
+            raise self.writing_error
         shutil.move(
             self.temp_partial_movie_file_path,
             self.partial_movie_file_path,
         )
+        if self.segment_hash is not None and self.should_cache_segments():
+            link_or_copy(
+                self.partial_movie_file_path,
+                self.get_cached_partial_movie_path(self.segment_hash),
+            )
 
     def combine_movie_files(self, indices):
         # Manim renders the scene as many smaller movie files
@@ -269,3 +349,8 @@ class SceneFileWriter(object):
 
     def print_file_ready_message(self, file_path):
         print("\nFile ready at {}\n".format(file_path))
+
+    def print_encoder_wait_message(self):
+        print("Spent {:.2f}s waiting on the encoder".format(
+            self.time_blocked_on_encoder
+        ))
@@ -33,6 +33,9 @@ class ZoomedScene(MovingCameraScene):
         MovingCameraScene.setup(self)
         # Initialize camera and display
         zoomed_camera = MovingCamera(**self.zoomed_camera_config)
+        # Both cameras look at the same mobjects, so they can
+        # share the work of keeping track of where those are
+        zoomed_camera.spatial_index = self.camera.spatial_index
         zoomed_display = ImageMobjectFromCamera(
             zoomed_camera, **self.zoomed_camera_image_mobject_config
         )
@@ -7,11 +7,16 @@ CLOSED_THRESHOLD = 0.001
 
 
 def bezier(points):
+    points = np.array(points)
     n = len(points) - 1
-    return lambda t: sum([
-        ((1 - t)**(n - k)) * (t**k) * choose(n, k) * point
-        for k, point in enumerate(points)
-    ])
+    exponents = np.arange(n + 1)
+    coefficients = get_binomial_coefficients(n)[n]
+
+    def result(t):
+        t = np.array(t, dtype=float)[..., np.newaxis]
+        weights = coefficients * (1 - t)**(n - exponents) * t**exponents
+        return np.dot(weights, points)
+    return result
 
 
 def partial_bezier_points(points, a, b):
@@ -21,21 +26,85 @@ def partial_bezier_points(points, a, b):
     return an array of the same size, which
     describes the portion of the original bezier
     curve on the interval [a, b].
+    """
+    return partial_bezier_curves(np.array([points]), a, b)[0]
+
+
+# Operations on many bezier curves of the same degree at once,
+# each given as a row of an array with shape
+# (n_curves, degree + 1, dimension)
+
+BINOMIAL_COEFFICIENTS_CACHE = {}
+
+
+def get_binomial_coefficients(n):
+    """
+    Returns an (n + 1) x (n + 1) array whose entry
+    at [i, j] is i choose j
+    """
+    if n not in BINOMIAL_COEFFICIENTS_CACHE:
+        BINOMIAL_COEFFICIENTS_CACHE[n] = np.array([
+            [choose(i, j) for j in range(n + 1)]
+            for i in range(n + 1)
+        ], dtype=float)
+    return BINOMIAL_COEFFICIENTS_CACHE[n]
+
 
-    This algorithm is pretty nifty, and pretty dense.
+def evaluate_bezier_curves(curves, t):
+    """
+    Returns the point at parameter t[i] along curves[i] for
+    each i, where t is either an array or a single number
     """
-    if a == 1:
-        return [points[-1]] * len(points)
-
-    a_to_1 = np.array([
-        bezier(points[i:])(a)
-        for i in range(len(points))
-    ])
-    end_prop = (b - a) / (1. - a)
-    return np.array([
-        bezier(a_to_1[:i + 1])(end_prop)
-        for i in range(len(points))
-    ])
+    curves = np.array(curves)
+    n = curves.shape[1] - 1
+    exponents = np.arange(n + 1)
+    t = np.broadcast_to(np.array(t, dtype=float), curves.shape[:1])
+    t = t[:, np.newaxis]
+    weights = get_binomial_coefficients(n)[n] * (1 - t)**(n - exponents) * t**exponents
+    return np.einsum("ck,ckd->cd", weights, curves)
+
+
+def partial_bezier_curves(curves, a, b):
+    """
+    Returns control points describing the portion of
+    curves[i] on the interval [a[i], b[i]] for each i, where
+    a and b are either arrays or single numbers with
+    0 <= a <= b <= 1.
+
+    The portion on [a, 1] comes from evaluating the trailing
+    control points at a, and the portion of that on [0, t]
+    from evaluating the leading control points at t.  Both
+    steps are linear in the control points, so they are
+    carried out as a single matrix for each curve.
+    """
+    curves = np.array(curves, dtype=float)
+    n = curves.shape[1] - 1
+    a = np.broadcast_to(np.array(a, dtype=float), curves.shape[:1])
+    b = np.broadcast_to(np.array(b, dtype=float), curves.shape[:1])
+    binomials = get_binomial_coefficients(n)
+    rows, cols = np.indices((n + 1, n + 1))
+    lower = cols <= rows
+    upper = cols >= rows
+
+    # Row i of this holds the weights giving bezier(points[i:])(a)
+    a = a[:, np.newaxis, np.newaxis]
+    to_end = np.where(
+        upper,
+        binomials[n - rows, np.where(upper, cols - rows, 0)] *
+        (1 - a)**(n - cols) * a**np.where(upper, cols - rows, 0),
+        0,
+    )
+    # Row i of this holds the weights giving bezier(points[:i + 1])(t)
+    safe_denominator = np.where(a < 1, 1 - a, 1)
+    t = np.where(a < 1, (b[:, np.newaxis, np.newaxis] - a) / safe_denominator, 1)
+    from_start = np.where(
+        lower,
+        binomials[rows, np.where(lower, cols, 0)] *
+        (1 - t)**np.where(lower, rows - cols, 0) * t**cols,
+        0,
+    )
+    matrices = np.matmul(from_start, to_end)
+    return np.matmul(matrices, curves)
 
 
 # Linear interpolation variants
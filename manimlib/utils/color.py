@@ -109,3 +109,90 @@ def get_shaded_rgb(rgb, point, unit_normal_vect, light_source):
     result = rgb + factor
     clip_in_place(rgb + factor, 0, 1)
     return result
+
+
+# Colors spaced evenly along some perceptually uniform
+# colormaps, which get_colormap interpolates between
+COLORMAPS = {
+    "viridis": [
+        "#440154", "#482475", "#414487", "#355F8D", "#2A788E", "#21918C",
+        "#22A884", "#44BF70", "#7AD151", "#BDDF26", "#FDE725",
+    ],
+    "magma": [
+        "#000004", "#140E36", "#3B0F70", "#641A80", "#8C2981", "#B73779",
+        "#DE4968", "#F7705C", "#FE9F6D", "#FECF92", "#FCFDBF",
+    ],
+    "inferno": [
+        "#000004", "#160B39", "#420A68", "#6A176E", "#932667", "#BC3754",
+        "#DD513A", "#F37819", "#FCA50A", "#F6D746", "#FCFFA4",
+    ],
+    "plasma": [
+        "#0D0887", "#41049D", "#6A00A8", "#8F0DA4", "#B12A90", "#CC4778",
+        "#E16462", "#F2844B", "#FCA636", "#FCCE25", "#F0F921",
+    ],
+    "grey": ["#000000", "#FFFFFF"],
+}
+DEFAULT_COLORMAP = "viridis"
+COLORMAP_SIZE = 256
+colormap_cache = dict()
+
+
+def get_colormap(colormap=DEFAULT_COLORMAP, size=COLORMAP_SIZE):
+    """
+    Returns a lookup table of size rgb values, running through
+    the colors of colormap, which is either the name of one of
+    COLORMAPS or a list of colors
+    """
+    if isinstance(colormap, str):
+        colors = COLORMAPS[colormap]
+    else:
+        colors = list(colormap)
+    key = (tuple(map(str, colors)), size)
+    if key not in colormap_cache:
+        rgbs = np.array(list(map(color_to_rgb, colors)))
+        anchors = np.linspace(0, 1, len(rgbs))
+        alphas = np.linspace(0, 1, size)
+        colormap_cache[key] = np.array([
+            np.interp(alphas, anchors, rgbs[:, i])
+            for i in range(3)
+        ]).T
+    return colormap_cache[key]
+
+
+def normalize_values(values, min_value=None, max_value=None):
+    """
+    Linearly maps values so that min_value and max_value, which
+    default to the extremes of values, go to 0 and 1, clipping
+    anything outside of that range
+    """
+    values = np.array(values, dtype=float)
+    if min_value is None:
+        min_value = np.nanmin(values) if values.size > 0 else 0
+    if max_value is None:
+        max_value = np.nanmax(values) if values.size > 0 else 1
+    if max_value == min_value:
+        return np.zeros(values.shape)
+    result = (values - min_value) / (max_value - min_value)
+    clip_in_place(result, 0, 1)
+    return result
+
+
+def values_to_rgbs(values, colormap=DEFAULT_COLORMAP,
+                   min_value=None, max_value=None):
+    """
+    Looks up the color of each of values in colormap, all
+    at once.  NaN values take the first color of the map.
+    """
+    table = get_colormap(colormap)
+    alphas = normalize_values(values, min_value, max_value)
+    indices = np.nan_to_num(alphas * (len(table) - 1)).round().astype(int)
+    return table[indices]
+
+
+def values_to_rgbas(values, colormap=DEFAULT_COLORMAP,
+                    min_value=None, max_value=None, opacity=1):
+    rgbs = values_to_rgbs(values, colormap, min_value, max_value)
+    rgbas = np.empty((*rgbs.shape[:-1], 4))
+    rgbas[..., :3] = rgbs
+    rgbas[..., 3] = opacity
+    return rgbas
@@ -1,5 +1,6 @@
 import inspect
 import itertools as it
+import operator
 
 
 def get_all_descendent_classes(Class):
@@ -20,6 +21,59 @@ def filtered_locals(caller_locals):
     return result
 
 
+class ConfigDict(dict):
+    """
+    The CONFIG of each class is turned into one of these the first
+    time it is merged, so that any later change to a CONFIG can be
+    noticed, and the merged CONFIGs depending on it worked out again
+    """
+    version = 0
+
+    def note_changed(self):
+        ConfigDict.version += 1
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.note_changed()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.note_changed()
+
+    def __ior__(self, other):
+        result = dict.__ior__(self, other)
+        self.note_changed()
+        return result
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self.note_changed()
+
+    def setdefault(self, key, default=None):
+        self.note_changed()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, *args):
+        self.note_changed()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.note_changed()
+        return dict.popitem(self)
+
+    def clear(self):
+        dict.clear(self)
+        self.note_changed()
+
+
+# Merged CONFIGs by class, along with what they were merged from.
+# Classes whose merged CONFIG has been set as class attributes are
+# kept as well, with the keys whose values are dicts or lists, which
+# are copied into each object instead.
+CLASS_CONFIG_CACHE = dict()
+CLASSES_WITH_CONFIG_DEFAULTS = dict()
+
+
 def digest_config(obj, kwargs, caller_locals={}):
     """
     Sets init args and CONFIG values as local variables
@@ -28,22 +82,110 @@ def digest_config(obj, kwargs, caller_locals={}):
     configuration of any object is inheritable, able to
     be easily passed into instantiation, and is attached
     as an attribute of the object.
+
+    Classes setting CONFIG_AS_CLASS_DEFAULTS to True keep their
+    CONFIG values as class attributes instead, see
+    digest_config_as_class_defaults.  This is not inherited, so
+    subclasses of such classes must set it themselves.
     """
+    if obj.__class__.__dict__.get("CONFIG_AS_CLASS_DEFAULTS", False):
+        digest_config_as_class_defaults(obj, kwargs, caller_locals)
+        return
 
-    # Assemble list of CONFIGs from all super classes
-    classes_in_hierarchy = [obj.__class__]
-    static_configs = []
-    while len(classes_in_hierarchy) > 0:
-        Class = classes_in_hierarchy.pop()
-        classes_in_hierarchy += Class.__bases__
-        if hasattr(Class, "CONFIG"):
-            static_configs.append(Class.CONFIG)
+    # CONFIGs from all super classes, merged once per class
+    class_config = get_class_config(obj.__class__)
 
     # Order matters a lot here, first dicts have higher priority
     caller_locals = filtered_locals(caller_locals)
-    all_dicts = [kwargs, caller_locals, obj.__dict__]
-    all_dicts += static_configs
+    all_dicts = [kwargs, caller_locals, obj.__dict__, class_config]
     obj.__dict__ = merge_dicts_recursively(*reversed(all_dicts))
+    # Nested dicts are shared by every instance of the class,
+    # so each object gets its own copy of them
+    for key in CLASS_CONFIG_CACHE[obj.__class__][-1]:
+        if obj.__dict__[key] is class_config[key]:
+            obj.__dict__[key] = copy_dicts_recursively(class_config[key])
+
+
+def get_class_config(Class):
+    """
+    Returns the CONFIG of Class merged with those of all its
+    super classes.  This is only worked out again after one of
+    the CONFIGs involved is changed or replaced.  Changes made
+    inside a nested dict of a CONFIG are not noticed.
+    """
+    entry = CLASS_CONFIG_CACHE.get(Class)
+    if entry is not None:
+        config_classes, configs, version, class_config, nested_keys = entry
+        current_configs = [Super.CONFIG for Super in config_classes]
+        if version == ConfigDict.version and all(
+            map(operator.is_, current_configs, configs)
+        ):
+            return class_config
+
+    # Assemble list of classes with CONFIGs, in order of priority
+    config_classes = []
+    classes_in_hierarchy = [Class]
+    while len(classes_in_hierarchy) > 0:
+        Super = classes_in_hierarchy.pop()
+        classes_in_hierarchy += Super.__bases__
+        if hasattr(Super, "CONFIG"):
+            config_classes.append(Super)
+    for Super in config_classes:
+        config = Super.__dict__.get("CONFIG")
+        if isinstance(config, dict) and not isinstance(config, ConfigDict):
+            Super.CONFIG = ConfigDict(config)
+    configs = [Super.CONFIG for Super in config_classes]
+    class_config = merge_dicts_recursively(*reversed(configs))
+    nested_keys = [
+        key for key, value in class_config.items()
+        if isinstance(value, dict)
+    ]
+    CLASS_CONFIG_CACHE[Class] = (
+        config_classes, configs, ConfigDict.version,
+        class_config, nested_keys,
+    )
+    CLASSES_WITH_CONFIG_DEFAULTS.pop(Class, None)
+    return class_config
+
+
+def digest_config_as_class_defaults(obj, kwargs, caller_locals={}):
+    """
+    Like digest_config, but the merged CONFIG is set as attributes
+    of the class of obj, the first time one is made.  obj itself
+    then only holds the values passed in for it, so that objects
+    made in bulk, like glyphs and points, each carry a much
+    smaller __dict__.
+
+    Values which are dicts or lists are not set on the class, since
+    changing them in place would change them for every object, so
+    each object gets its own copy of those.
+    """
+    Class = obj.__class__
+    class_config = get_class_config(Class)
+    mutable_keys = CLASSES_WITH_CONFIG_DEFAULTS.get(Class)
+    if mutable_keys is None:
+        mutable_keys = []
+        for key, value in class_config.items():
+            if isinstance(value, (dict, list)):
+                mutable_keys.append(key)
+            # As with digest_config, properties are not overridden
+            elif not isinstance(getattr(Class, key, None), property):
+                setattr(Class, key, value)
+        CLASSES_WITH_CONFIG_DEFAULTS[Class] = mutable_keys
+    for key in mutable_keys:
+        value = class_config[key]
+        if isinstance(value, dict):
+            obj.__dict__[key] = copy_dicts_recursively(value)
+        else:
+            obj.__dict__[key] = list(value)
+
+    overrides = filtered_locals(caller_locals)
+    overrides.update(kwargs)
+    for key, value in overrides.items():
+        current = getattr(obj, key, None)
+        if isinstance(current, dict) and isinstance(value, dict):
+            value = merge_dicts_recursively(current, value)
+        obj.__dict__[key] = value
 
 
 def merge_dicts_recursively(*dicts):
@@ -56,8 +198,11 @@ def merge_dicts_recursively(*dicts):
 
     When values are dictionaries, it is applied recursively
     """
-    result = dict()
-    all_items = it.chain(*[d.items() for d in dicts])
+    if len(dicts) == 0:
+        return dict()
+    # Nothing needs merging until the second dict
+    result = dict(dicts[0])
+    all_items = it.chain(*[d.items() for d in dicts[1:]])
     for key, value in all_items:
         if key in result and isinstance(result[key], dict) and isinstance(value, dict):
             result[key] = merge_dicts_recursively(result[key], value)
@@ -66,6 +211,13 @@ def merge_dicts_recursively(*dicts):
     return result
 
 
+def copy_dicts_recursively(d):
+    return dict([
+        (key, copy_dicts_recursively(value) if isinstance(value, dict) else value)
+        for key, value in d.items()
+    ])
+
+
 def soft_dict_update(d1, d2):
     """
     Adds key values pairs of d2 to d1 only when d1 doesn't
@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 import numpy as np
 
 
@@ -16,6 +18,29 @@ def guarantee_existence(path):
     return os.path.abspath(path)
 
 
+def link_or_copy(source, destination):
+    # Hard links avoid duplicating large files, but are not
+    # available on every file system.  The temporary file has a
+    # name of its own, so that processes writing the same
+    # destination at once don't interfere with each other.
+    handle, temp_destination = tempfile.mkstemp(
+        dir=os.path.dirname(destination),
+        prefix="." + os.path.basename(destination),
+    )
+    os.close(handle)
+    try:
+        os.remove(temp_destination)
+        try:
+            os.link(source, temp_destination)
+        except OSError:
+            shutil.copyfile(source, temp_destination)
+        os.replace(temp_destination, destination)
+    finally:
+        if os.path.exists(temp_destination):
+            os.remove(temp_destination)
+    return destination
+
+
 def seek_full_path_from_defaults(file_name, default_dir, extensions):
     possible_paths = [file_name]
     possible_paths += [
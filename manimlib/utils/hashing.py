@@ -0,0 +1,138 @@
+import functools
+import hashlib
+import types
+
+import numpy as np
+
+
+# Changing how objects are described below should change this,
+# so that hashes from earlier versions are not mistaken for new ones
+HASH_FORMAT_VERSION = "manimlib-1.0/1"
+
+
+def get_hash_from_objects(*objects, opaque_types=()):
+    """
+    Returns a hex digest describing the full state of the given
+    objects, following their attributes, containers and the code
+    and closures of any functions among them.  Instances of
+    opaque_types only contribute their class name, which keeps
+    things like scenes and cameras from being walked through.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(HASH_FORMAT_VERSION.encode())
+    memo = dict()
+    for obj in objects:
+        update_hash_with_object(hasher, obj, memo, opaque_types)
+    return hasher.hexdigest()
+
+
+def update_hash_with_object(hasher, obj, memo, opaque_types=()):
+    def update(*strings):
+        for string in strings:
+            hasher.update(string.encode())
+
+    def recurse(value):
+        update_hash_with_object(hasher, value, memo, opaque_types)
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        update(type(obj).__name__, repr(obj), ";")
+        return
+    if isinstance(obj, np.generic):
+        update(obj.dtype.str, repr(obj.item()), ";")
+        return
+    if isinstance(obj, np.ndarray):
+        update("ndarray", obj.dtype.str, str(obj.shape))
+        if obj.dtype == object:
+            for value in obj.flat:
+                recurse(value)
+        else:
+            hasher.update(np.ascontiguousarray(obj).data)
+        return
+
+    # Anything which might be reached twice is only described once,
+    # so that cyclic references terminate.  The memo keeps a reference
+    # to each object so that its id cannot be reused while hashing.
+    if id(obj) in memo:
+        update("ref", str(memo[id(obj)][0]), ";")
+        return
+    memo[id(obj)] = (len(memo), obj)
+
+    if isinstance(obj, (list, tuple)):
+        update(type(obj).__name__, str(len(obj)))
+        for value in obj:
+            recurse(value)
+    elif isinstance(obj, dict):
+        update("dict", str(len(obj)))
+        for key in sort_by_hash(obj.keys(), opaque_types):
+            recurse(key)
+            recurse(obj[key])
+    elif isinstance(obj, (set, frozenset)):
+        update("set", str(len(obj)))
+        for value in sort_by_hash(obj, opaque_types):
+            recurse(value)
+    elif isinstance(obj, type):
+        update("type", obj.__module__, obj.__qualname__, ";")
+    elif isinstance(obj, types.ModuleType):
+        update("module", obj.__name__, ";")
+    elif isinstance(obj, types.MethodType):
+        update("method")
+        recurse(obj.__func__)
+        recurse(obj.__self__)
+    elif isinstance(obj, types.FunctionType):
+        update("function", obj.__module__, obj.__qualname__)
+        recurse(obj.__code__)
+        recurse(obj.__defaults__)
+        recurse(obj.__kwdefaults__)
+        cells = obj.__closure__ or ()
+        for cell in cells:
+            try:
+                recurse(cell.cell_contents)
+            except ValueError:
+                # Empty cell
+                update("empty_cell")
+    elif isinstance(obj, types.CodeType):
+        update("code", obj.co_name)
+        hasher.update(obj.co_code)
+        recurse(obj.co_consts)
+        recurse(obj.co_names)
+    elif isinstance(obj, functools.partial):
+        update("partial")
+        recurse(obj.func)
+        recurse(obj.args)
+        recurse(obj.keywords)
+    elif isinstance(obj, opaque_types):
+        update("opaque", type(obj).__qualname__, ";")
+    elif hasattr(obj, "__dict__"):
+        recurse(type(obj))
+        recurse(get_state(obj))
+    else:
+        text = repr(obj)
+        if " at 0x" in text:
+            # Memory addresses vary from run to run
+            text = type(obj).__qualname__
+        update("object", text, ";")
+
+
+def sort_by_hash(values, opaque_types=()):
+    """
+    Orders the keys of a dict, or the elements of a set, by their
+    own hashes, since their order of iteration, and reprs such as
+    those of mobjects, can differ between otherwise equal runs
+    """
+    def get_digest(value):
+        hasher = hashlib.sha256()
+        update_hash_with_object(hasher, value, dict(), opaque_types)
+        return hasher.digest()
+    return sorted(values, key=get_digest)
+
+
+def get_state(obj):
+    """
+    Objects which leave cached values out of their pickled
+    state, by defining __getstate__, are described by that
+    state rather than their full __dict__
+    """
+    getstate = getattr(type(obj), "__getstate__", None)
+    if getstate is None or getstate is getattr(object, "__getstate__", None):
+        return obj.__dict__
+    return obj.__getstate__()
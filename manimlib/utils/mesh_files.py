@@ -0,0 +1,614 @@
+import hashlib
+import os
+import xml.etree.ElementTree as ElementTree
+
+import numpy as np
+
+from manimlib.constants import MESH_CACHE_DIR
+from manimlib.constants import MESH_DIR
+from manimlib.utils.file_ops import seek_full_path_from_defaults
+
+# Gmsh element types which can be drawn as triangles, with the
+# number of nodes of each element, and the triangles it is split
+# into, in terms of its corner nodes
+GMSH_ELEMENT_TRIANGLES = {
+    2: (3, [[0, 1, 2]]),
+    3: (4, [[0, 1, 2], [0, 2, 3]]),
+    9: (6, [[0, 1, 2]]),
+    10: (9, [[0, 1, 2], [0, 2, 3]]),
+    16: (8, [[0, 1, 2], [0, 2, 3]]),
+}
+
+# Number of nodes of the other element types, which binary
+# files give no other way of stepping over
+GMSH_ELEMENT_NUM_NODES = {
+    1: 2, 2: 3, 3: 4, 4: 4, 5: 8, 6: 6, 7: 5, 8: 3, 9: 6, 10: 9,
+    11: 10, 12: 27, 13: 18, 14: 14, 15: 1, 16: 8, 17: 20, 18: 15,
+    19: 13, 20: 9, 21: 10, 22: 12, 23: 15, 24: 15, 25: 21, 26: 4,
+    27: 5, 28: 6, 29: 20, 30: 35, 31: 56,
+}
+
+XDMF_TOPOLOGY_TRIANGLES = {
+    "triangle": [[0, 1, 2]],
+    "quadrilateral": [[0, 1, 2], [0, 2, 3]],
+}
+
+XDMF_NUMBER_TYPES = {
+    "float": "f",
+    "int": "i",
+    "uint": "u",
+    "char": "i",
+    "uchar": "u",
+}
+
+mesh_file_cache = dict()
+
+
+class MeshFile(object):
+    """
+    A mesh read from disk.  points is an array with a row for
+    each node, and cells an array of node indices with a row for
+    each triangle.  Where the format allows, these are views into
+    a memory map of the file rather than copies.
+
+    Nodal fields are only located when the file is read, and each
+    time step is read from disk when asked for with get_field, so
+    that a long time series never needs to fit in memory.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.points = np.zeros((0, 3))
+        self.cells = np.zeros((0, 3), dtype=int)
+        # Field name to a list of (time, location) pairs, where
+        # location is whatever read_field needs to find the data
+        self.fields = dict()
+        self.read()
+
+    def read(self):
+        raise Exception("Not implemented")
+
+    def read_field(self, location):
+        raise Exception("Not implemented")
+
+    def add_field_location(self, name, time, location):
+        steps = self.fields.setdefault(name, [])
+        if time is None:
+            time = float(len(steps))
+        steps.append((time, location))
+
+    def get_field_names(self):
+        return list(self.fields.keys())
+
+    def get_num_time_steps(self, name):
+        return len(self.fields[name])
+
+    def get_times(self, name):
+        return np.array([time for time, location in self.fields[name]])
+
+    def get_field(self, name, time_step=0):
+        """
+        Returns the values of a field at each node, with one
+        row per node for fields with several components
+        """
+        if name not in self.fields:
+            raise Exception("{} has no field {}, only {}".format(
+                self.file_path, name, ", ".join(self.fields)
+            ))
+        time, location = self.fields[name][time_step]
+        return self.read_field(location)
+
+    def get_file_map(self):
+        if not hasattr(self, "file_map"):
+            self.file_map = np.memmap(self.file_path, dtype=np.uint8, mode="r")
+        return self.file_map
+
+    def map_array(self, offset, dtype, shape):
+        """
+        An array of the given dtype and shape stored in the
+        file from offset, read lazily from the memory map
+        """
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        if size == 0:
+            return np.zeros(shape, dtype=dtype)
+        num_bytes = size * dtype.itemsize
+        return self.get_file_map()[offset:offset + num_bytes].view(
+            dtype
+        ).reshape(shape)
+
+    def get_cells_from_elements(self, elements, triangles):
+        """
+        Splits each row of elements, holding node indices, into
+        the given triangles of its corners
+        """
+        return np.array(elements)[:, triangles].reshape((-1, 3))
+
+
+class GmshFile(MeshFile):
+    """
+    A Gmsh .msh file, in version 2.2 or 4.1 of the format, ascii
+    or binary.  Triangles and quadrilaterals, of any order, are
+    kept as cells, using their corner nodes, and every other kind
+    of element is skipped.  Fields are read from $NodeData.
+    """
+
+    def read(self):
+        self.version = None
+        self.binary = False
+        self.endian = "<"
+        self.size_t = "u8"
+        self.node_tags = np.zeros(0, dtype=int)
+        self.triangle_tags = []
+        with open(self.file_path, "rb") as file:
+            line = file.readline()
+            while line:
+                section = line.strip()
+                if section == b"$MeshFormat":
+                    self.read_mesh_format(file)
+                elif section == b"$Nodes":
+                    self.read_nodes(file)
+                elif section == b"$Elements":
+                    self.read_elements(file)
+                elif section == b"$NodeData":
+                    self.read_node_data(file)
+                elif section.startswith(b"$"):
+                    self.skip_section(file, section)
+                line = file.readline()
+        if self.version is None:
+            raise Exception("{} is not a Gmsh file".format(self.file_path))
+        if len(self.triangle_tags) > 0:
+            tags = np.concatenate(self.triangle_tags)
+        else:
+            tags = np.zeros((0, 3), dtype=int)
+        self.cells = self.tags_to_indices(tags)
+        del self.triangle_tags
+
+    def skip_section(self, file, section):
+        end = b"$End" + section[1:]
+        line = file.readline()
+        while line and line.strip() != end:
+            line = file.readline()
+
+    def skip_to_end(self, file, section):
+        # After binary data there is a newline before the end
+        # of the section
+        self.skip_section(file, b"$" + section)
+
+    def read_mesh_format(self, file):
+        version, file_type, data_size = file.readline().split()
+        self.version = version.decode()
+        self.binary = int(file_type) == 1
+        self.size_t = "u{}".format(int(data_size))
+        if self.binary:
+            one = file.read(4)
+            file.readline()
+            if np.frombuffer(one, dtype="<i4")[0] == 1:
+                self.endian = "<"
+            else:
+                self.endian = ">"
+        if not (self.version.startswith("2") or self.version == "4.1"):
+            raise Exception(
+                "Gmsh files of version {} are not supported, ".format(
+                    self.version
+                ) + "save as version 2.2 or 4.1"
+            )
+        self.skip_to_end(file, b"MeshFormat")
+
+    def is_version_4(self):
+        return self.version.startswith("4")
+
+    def get_dtype(self, kind):
+        return np.dtype(self.endian + {
+            "int": "i4",
+            "size_t": self.size_t,
+            "double": "f8",
+        }[kind])
+
+    def read_binary(self, file, kind, count):
+        dtype = self.get_dtype(kind)
+        return np.frombuffer(file.read(count * dtype.itemsize), dtype=dtype)
+
+    def map_binary(self, file, dtype, shape):
+        offset = file.tell()
+        result = self.map_array(offset, dtype, shape)
+        file.seek(offset + int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return result
+
+    def read_ascii(self, file, count, dtype):
+        """
+        Reads count lines of numbers, which should all be of
+        the same length
+        """
+        lines = [file.readline() for x in range(count)]
+        values = np.array(b" ".join(lines).split(), dtype=dtype)
+        if count == 0:
+            return values.reshape((0, 0))
+        return values.reshape((count, -1))
+
+    def read_header(self, file, kinds):
+        if self.binary:
+            return [
+                self.read_binary(file, kind, 1)[0]
+                for kind in kinds
+            ]
+        return [int(value) for value in file.readline().split()]
+
+    # Nodes
+    def read_nodes(self, file):
+        if self.is_version_4():
+            tags, points = self.read_nodes_v4(file)
+        else:
+            tags, points = self.read_nodes_v2(file)
+        self.node_tags = tags
+        self.points = points
+        self.skip_to_end(file, b"Nodes")
+
+    def read_nodes_v2(self, file):
+        num_nodes = int(file.readline())
+        if self.binary:
+            records = self.map_binary(file, np.dtype([
+                ("tag", self.get_dtype("int")),
+                ("coords", self.get_dtype("double"), (3,)),
+            ]), (num_nodes,))
+            return records["tag"], records["coords"]
+        values = self.read_ascii(file, num_nodes, float)
+        return values[:, 0].astype(int), values[:, 1:4]
+
+    def read_nodes_v4(self, file):
+        num_blocks, num_nodes, min_tag, max_tag = self.read_header(
+            file, ["size_t"] * 4
+        )
+        tag_blocks = []
+        point_blocks = []
+        for x in range(num_blocks):
+            dim, entity, parametric, count = self.read_header(
+                file, ["int", "int", "int", "size_t"]
+            )
+            num_coords = 3 + (dim if parametric else 0)
+            if self.binary:
+                tags = self.map_binary(
+                    file, self.get_dtype("size_t"), (count,)
+                )
+                coords = self.map_binary(
+                    file, self.get_dtype("double"), (count, num_coords)
+                )
+            else:
+                tags = self.read_ascii(file, count, int).reshape(count)
+                coords = self.read_ascii(file, count, float)
+            tag_blocks.append(tags)
+            point_blocks.append(coords.reshape((count, num_coords))[:, :3])
+        if len(tag_blocks) == 1:
+            return tag_blocks[0], point_blocks[0]
+        if len(tag_blocks) == 0:
+            return np.zeros(0, dtype=int), np.zeros((0, 3))
+        return np.concatenate(tag_blocks), np.concatenate(point_blocks)
+
+    def tags_to_indices(self, tags):
+        tags = np.array(tags, dtype=np.int64)
+        node_tags = np.array(self.node_tags, dtype=np.int64)
+        if len(node_tags) == 0:
+            return tags
+        first_tag = node_tags[0]
+        last_tag = node_tags[-1]
+        if last_tag - first_tag == len(node_tags) - 1 and np.all(
+            node_tags == np.arange(first_tag, last_tag + 1)
+        ):
+            # Nodes are almost always numbered consecutively
+            return tags - first_tag
+        if not hasattr(self, "tag_lookup"):
+            self.tag_lookup = np.full(node_tags.max() + 1, -1)
+            self.tag_lookup[node_tags] = np.arange(len(node_tags))
+        return self.tag_lookup[tags]
+
+    # Elements
+    def read_elements(self, file):
+        if self.is_version_4():
+            self.read_elements_v4(file)
+        elif self.binary:
+            self.read_elements_v2_binary(file)
+        else:
+            self.read_elements_v2_ascii(file)
+        self.skip_to_end(file, b"Elements")
+
+    def add_elements(self, element_type, nodes):
+        if element_type not in GMSH_ELEMENT_TRIANGLES:
+            return
+        num_nodes, triangles = GMSH_ELEMENT_TRIANGLES[element_type]
+        self.triangle_tags.append(
+            self.get_cells_from_elements(nodes, triangles)
+        )
+
+    def get_num_element_nodes(self, element_type):
+        if element_type not in GMSH_ELEMENT_NUM_NODES:
+            raise Exception(
+                "Unknown Gmsh element type {}".format(element_type)
+            )
+        return GMSH_ELEMENT_NUM_NODES[element_type]
+
+    def read_elements_v2_ascii(self, file):
+        num_elements = int(file.readline())
+        nodes_by_type = dict()
+        for x in range(num_elements):
+            values = file.readline().split()
+            element_type = int(values[1])
+            if element_type in GMSH_ELEMENT_TRIANGLES:
+                num_tags = int(values[2])
+                nodes_by_type.setdefault(element_type, []).append(
+                    values[3 + num_tags:]
+                )
+        for element_type, nodes in nodes_by_type.items():
+            self.add_elements(element_type, np.array(nodes, dtype=int))
+
+    def read_elements_v2_binary(self, file):
+        num_elements = int(file.readline())
+        num_read = 0
+        while num_read < num_elements:
+            element_type, count, num_tags = self.read_binary(file, "int", 3)
+            num_nodes = self.get_num_element_nodes(element_type)
+            elements = self.map_binary(
+                file, self.get_dtype("int"),
+                (count, 1 + num_tags + num_nodes)
+            )
+            self.add_elements(element_type, elements[:, 1 + num_tags:])
+            num_read += count
+
+    def read_elements_v4(self, file):
+        num_blocks, num_elements, min_tag, max_tag = self.read_header(
+            file, ["size_t"] * 4
+        )
+        for x in range(num_blocks):
+            dim, entity, element_type, count = self.read_header(
+                file, ["int", "int", "int", "size_t"]
+            )
+            if self.binary:
+                num_nodes = self.get_num_element_nodes(element_type)
+                elements = self.map_binary(
+                    file, self.get_dtype("size_t"), (count, 1 + num_nodes)
+                )
+            else:
+                elements = self.read_ascii(file, count, int)
+            self.add_elements(element_type, elements[:, 1:])
+
+    # Fields
+    def read_node_data(self, file):
+        string_tags = [
+            file.readline().strip().strip(b'"').decode()
+            for x in range(int(file.readline()))
+        ]
+        real_tags = [
+            float(file.readline())
+            for x in range(int(file.readline()))
+        ]
+        int_tags = [
+            int(file.readline())
+            for x in range(int(file.readline()))
+        ]
+        name = string_tags[0] if string_tags else "field"
+        time = real_tags[0] if real_tags else None
+        num_components, num_values = int_tags[1:3]
+        offset = file.tell()
+        if self.binary:
+            file.seek(offset + num_values * (
+                self.get_dtype("int").itemsize +
+                num_components * self.get_dtype("double").itemsize
+            ))
+        else:
+            for x in range(num_values):
+                file.readline()
+        self.add_field_location(
+            name, time, (offset, num_values, num_components)
+        )
+        self.skip_to_end(file, b"NodeData")
+
+    def read_field(self, location):
+        offset, num_values, num_components = location
+        if self.binary:
+            records = self.map_array(offset, np.dtype([
+                ("tag", self.get_dtype("int")),
+                ("values", self.get_dtype("double"), (num_components,)),
+            ]), (num_values,))
+            tags = records["tag"]
+            values = records["values"]
+        else:
+            with open(self.file_path, "rb") as file:
+                file.seek(offset)
+                data = self.read_ascii(file, num_values, float)
+            tags = data[:, 0].astype(int)
+            values = data[:, 1:].reshape((num_values, num_components))
+        field = np.full((len(self.points), num_components), np.nan)
+        field[self.tags_to_indices(tags)] = values
+        if num_components == 1:
+            return field[:, 0]
+        return field
+
+
+class XdmfFile(MeshFile):
+    """
+    An XDMF file, as written by e.g. FEniCS or meshio.  The mesh
+    is the first Topology and Geometry in the file, and fields
+    are the nodal Attributes of each Grid, at the Time given in
+    that Grid.  Heavy data may be inline, in raw binary files, or
+    in HDF5 files, which need h5py.
+    """
+
+    def read(self):
+        self.directory = os.path.dirname(os.path.abspath(self.file_path))
+        root = ElementTree.parse(self.file_path).getroot()
+        topology = self.find_first(root, "Topology")
+        geometry = self.find_first(root, "Geometry")
+        if topology is None or geometry is None:
+            raise Exception(
+                "{} has no Topology or Geometry".format(self.file_path)
+            )
+        self.read_geometry(geometry)
+        self.read_topology(topology)
+        for grid in root.iter("Grid"):
+            time = None
+            attributes = []
+            for child in grid:
+                if child.tag == "Time":
+                    time = float(child.get("Value"))
+                elif child.tag == "Attribute":
+                    attributes.append(child)
+            for attribute in attributes:
+                if attribute.get("Center", "Node") != "Node":
+                    continue
+                self.add_field_location(
+                    attribute.get("Name"), time,
+                    attribute.find("DataItem")
+                )
+
+    def find_first(self, root, tag):
+        for element in root.iter(tag):
+            if element.find("DataItem") is not None:
+                return element
+        return None
+
+    def read_geometry(self, geometry):
+        geometry_type = geometry.get(
+            "GeometryType", geometry.get("Type", "XYZ")
+        ).upper()
+        data = self.read_data_item(geometry.find("DataItem"))
+        if geometry_type not in ["XY", "XYZ"]:
+            raise Exception(
+                "Unsupported XDMF geometry type {}".format(geometry_type)
+            )
+        data = data.reshape((-1, len(geometry_type)))
+        if geometry_type == "XY":
+            points = np.zeros((len(data), 3))
+            points[:, :2] = data
+            data = points
+        self.points = data
+
+    def read_topology(self, topology):
+        topology_type = topology.get(
+            "TopologyType", topology.get("Type", "")
+        ).lower()
+        if topology_type not in XDMF_TOPOLOGY_TRIANGLES:
+            raise Exception(
+                "Unsupported XDMF topology type {}".format(topology_type)
+            )
+        triangles = XDMF_TOPOLOGY_TRIANGLES[topology_type]
+        elements = self.read_data_item(topology.find("DataItem"))
+        elements = elements.reshape((-1, np.max(triangles) + 1))
+        self.cells = self.get_cells_from_elements(elements, triangles)
+
+    def get_data_item_dtype(self, data_item):
+        number_type = data_item.get(
+            "NumberType", data_item.get("DataType", "Float")
+        ).lower()
+        precision = int(data_item.get("Precision", 4))
+        if number_type in ["char", "uchar"]:
+            precision = 1
+        endian = {
+            "big": ">",
+            "little": "<",
+        }.get(data_item.get("Endian", "Native").lower(), "=")
+        return np.dtype(endian + XDMF_NUMBER_TYPES[number_type] + str(precision))
+
+    def read_data_item(self, data_item):
+        shape = tuple(
+            int(dim) for dim in data_item.get("Dimensions").split()
+        )
+        data_format = data_item.get("Format", "XML").upper()
+        text = data_item.text.strip()
+        if data_format == "XML":
+            dtype = self.get_data_item_dtype(data_item)
+            return np.array(text.split(), dtype=dtype).reshape(shape)
+        if data_format == "HDF":
+            return self.read_hdf5(text, shape)
+        if data_format == "BINARY":
+            dtype = self.get_data_item_dtype(data_item)
+            offset = int(data_item.get("Seek", 0))
+            path = os.path.join(self.directory, text)
+            return np.memmap(
+                path, dtype=dtype, mode="r", offset=offset, shape=shape
+            )
+        raise Exception("Unsupported XDMF data format {}".format(data_format))
+
+    def read_hdf5(self, text, shape):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError(
+                "Reading {} needs h5py, which can be installed with "
+                "pip install h5py".format(self.file_path)
+            )
+        file_name, dataset_name = text.split(":", 1)
+        path = os.path.join(self.directory, file_name)
+        with h5py.File(path, "r") as h5_file:
+            dataset = h5_file[dataset_name]
+            offset = dataset.id.get_offset()
+            if offset is None or dataset.dtype.kind not in "fiu":
+                # Chunked or compressed data can't be mapped
+                return dataset[()].reshape(shape)
+            dtype = dataset.dtype
+        return np.memmap(
+            path, dtype=dtype, mode="r", offset=offset, shape=shape
+        )
+
+    def read_field(self, data_item):
+        data = self.read_data_item(data_item)
+        data = data.reshape((len(self.points), -1))
+        if data.shape[1] == 1:
+            return data[:, 0]
+        return data
+
+
+def get_full_mesh_file_path(file_name):
+    return seek_full_path_from_defaults(
+        file_name,
+        default_dir=MESH_DIR,
+        extensions=[".msh", ".xdmf", ".xmf", ".geo"]
+    )
+
+
+def geo_to_msh(geo_file):
+    """
+    Meshes a Gmsh .geo file, which needs gmsh to be installed.
+    The result is cached, by the contents of the .geo file.
+    """
+    with open(geo_file, "rb") as infile:
+        geo_hash = hashlib.sha256(infile.read()).hexdigest()[:16]
+    result = os.path.join(MESH_CACHE_DIR, geo_hash + ".msh")
+    if not os.path.exists(result):
+        temp_result = os.path.join(
+            MESH_CACHE_DIR, ".{}.{}.msh".format(geo_hash, os.getpid())
+        )
+        commands = [
+            "gmsh",
+            "\"{}\"".format(geo_file),
+            "-2",
+            "-format msh41",
+            "-bin",
+            "-v 0",
+            "-o",
+            "\"{}\"".format(temp_result),
+            ">",
+            os.devnull
+        ]
+        exit_code = os.system(" ".join(commands))
+        if exit_code != 0 or not os.path.exists(temp_result):
+            raise Exception(
+                "Gmsh error meshing {}, is gmsh installed?".format(geo_file)
+            )
+        os.replace(temp_result, result)
+    return result
+
+
+def open_mesh_file(file_name):
+    """
+    Returns a MeshFile for a .msh, .xdmf or .geo file.  These are
+    shared, so that mobjects from the same file don't read it again.
+    """
+    path = os.path.abspath(get_full_mesh_file_path(file_name))
+    if path.endswith(".geo"):
+        path = geo_to_msh(path)
+    key = (path, os.path.getmtime(path))
+    if key not in mesh_file_cache:
+        if path.endswith(".xdmf") or path.endswith(".xmf"):
+            mesh_file_cache[key] = XdmfFile(path)
+        else:
+            mesh_file_cache[key] = GmshFile(path)
+    return mesh_file_cache[key]
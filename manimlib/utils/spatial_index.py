@@ -0,0 +1,283 @@
+import heapq
+import itertools as it
+
+import numpy as np
+
+from manimlib.constants import FRAME_X_RADIUS
+from manimlib.constants import FRAME_Y_RADIUS
+
+
+# Boxes are tuples (x_min, y_min, x_max, y_max).  Comparisons are
+# written so that a box with nan in it meets everything.
+
+def boxes_meet(box1, box2):
+    return not (
+        box1[2] < box2[0] or box1[0] > box2[2] or
+        box1[3] < box2[1] or box1[1] > box2[3]
+    )
+
+
+def box_contains(outer_box, inner_box):
+    return (
+        outer_box[0] <= inner_box[0] and inner_box[2] <= outer_box[2] and
+        outer_box[1] <= inner_box[1] and inner_box[3] <= outer_box[3]
+    )
+
+
+def distance_to_box(point, box):
+    dx = max(box[0] - point[0], 0, point[0] - box[2])
+    dy = max(box[1] - point[1], 0, point[1] - box[3])
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def get_union_box(boxes):
+    boxes = np.array(list(boxes), dtype=float).reshape((-1, 4))
+    return (
+        *np.nanmin(boxes[:, :2], axis=0),
+        *np.nanmax(boxes[:, 2:], axis=0),
+    )
+
+
+class QuadTreeNode(object):
+    def __init__(self, bounds, depth):
+        self.bounds = bounds
+        self.depth = depth
+        self.items = dict()
+        self.children = None
+
+    def split(self):
+        x0, y0, x1, y1 = self.bounds
+        xm = (x0 + x1) / 2
+        ym = (y0 + y1) / 2
+        self.children = [
+            QuadTreeNode(bounds, self.depth + 1)
+            for bounds in [
+                (x0, y0, xm, ym), (xm, y0, x1, ym),
+                (x0, ym, xm, y1), (xm, ym, x1, y1),
+            ]
+        ]
+
+    def get_child_containing(self, box):
+        for child in self.children:
+            if box_contains(child.bounds, box):
+                return child
+        return None
+
+
+class QuadTree(object):
+    """
+    Holds boxes under hashable keys, so that those meeting a
+    region, or nearest to a point, are found without looking at
+    most of the others.  Each box lives in the smallest node which
+    holds all of it, and those reaching outside the bounds of the
+    tree live in its root, until there are enough of them that the
+    tree is rebuilt around everything it holds.
+    """
+
+    def __init__(self, bounds=None, max_items=8, max_depth=12):
+        if bounds is None:
+            bounds = (
+                -FRAME_X_RADIUS, -FRAME_Y_RADIUS,
+                FRAME_X_RADIUS, FRAME_Y_RADIUS,
+            )
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.root = QuadTreeNode(bounds, 0)
+        self.key_to_node = dict()
+        self.outside_keys = set()
+
+    def __len__(self):
+        return len(self.key_to_node)
+
+    def __contains__(self, key):
+        return key in self.key_to_node
+
+    def insert(self, key, box):
+        if key in self.key_to_node:
+            self.remove(key)
+        if not box_contains(self.root.bounds, box):
+            self.outside_keys.add(key)
+        self.insert_into_node(self.root, key, box)
+        too_many_outside = max(self.max_items, len(self) // 8)
+        if len(self.outside_keys) > too_many_outside:
+            self.rebuild()
+
+    def insert_into_node(self, node, key, box):
+        while node.children is not None:
+            child = node.get_child_containing(box)
+            if child is None:
+                break
+            node = child
+        node.items[key] = box
+        self.key_to_node[key] = node
+        if node.children is None and len(node.items) > self.max_items \
+                and node.depth < self.max_depth:
+            node.split()
+            for item_key, item_box in list(node.items.items()):
+                child = node.get_child_containing(item_box)
+                if child is not None:
+                    del node.items[item_key]
+                    self.insert_into_node(child, item_key, item_box)
+
+    def remove(self, key):
+        node = self.key_to_node.pop(key)
+        del node.items[key]
+        self.outside_keys.discard(key)
+
+    def get_items(self):
+        return [
+            (key, node.items[key])
+            for key, node in self.key_to_node.items()
+        ]
+
+    def rebuild(self, bounds=None):
+        items = self.get_items()
+        if bounds is None and len(items) > 0:
+            bounds = get_union_box([box for key, box in items])
+        if bounds is None or np.any(np.isnan(bounds)):
+            bounds = self.root.bounds
+        self.root = QuadTreeNode(tuple(bounds), 0)
+        self.key_to_node = dict()
+        self.outside_keys = set()
+        for key, box in items:
+            if not box_contains(self.root.bounds, box):
+                self.outside_keys.add(key)
+            self.insert_into_node(self.root, key, box)
+
+    def query(self, box):
+        """
+        Returns the keys of all boxes meeting box
+        """
+        result = []
+        to_visit = [self.root]
+        while to_visit:
+            node = to_visit.pop()
+            # Only the root holds boxes reaching past its bounds
+            if node is not self.root:
+                if not boxes_meet(node.bounds, box):
+                    continue
+                if box_contains(box, node.bounds):
+                    result.extend(self.get_subtree_keys(node))
+                    continue
+            result.extend([
+                key for key, item_box in node.items.items()
+                if boxes_meet(item_box, box)
+            ])
+            if node.children is not None:
+                to_visit.extend(node.children)
+        return result
+
+    def get_subtree_keys(self, node):
+        result = []
+        to_visit = [node]
+        while to_visit:
+            node = to_visit.pop()
+            result.extend(node.items)
+            if node.children is not None:
+                to_visit.extend(node.children)
+        return result
+
+    def nearest(self, point, key_filter=None):
+        """
+        Returns the key of the box nearest to point, among those
+        whose keys pass key_filter, or None if there are none.
+        Nodes are visited closest first, and no further once
+        none can hold anything closer than what has been found.
+        """
+        best_key = None
+        best_distance = np.inf
+        counter = it.count()
+        to_visit = [(0, next(counter), self.root)]
+        while to_visit:
+            node_distance, _, node = heapq.heappop(to_visit)
+            if node_distance >= best_distance:
+                break
+            for key, box in node.items.items():
+                if key_filter is not None and not key_filter(key):
+                    continue
+                distance = distance_to_box(point, box)
+                if distance < best_distance:
+                    best_key = key
+                    best_distance = distance
+            if node.children is not None:
+                for child in node.children:
+                    heapq.heappush(to_visit, (
+                        distance_to_box(point, child.bounds),
+                        next(counter),
+                        child,
+                    ))
+        return best_key
+
+
+class SpatialIndex(object):
+    """
+    A QuadTree of the boxes around the points of mobjects, each
+    taken alone rather than with its family, as cameras draw them.
+    update only looks again at mobjects whose points have changed
+    since they were last indexed, so it stays cheap for scenes with
+    many thousands of mobjects, most of which sit still.
+    """
+
+    def __init__(self, **kwargs):
+        self.tree = QuadTree(**kwargs)
+        # Pairs of a mobject and its points version
+        # when it was indexed, by id
+        self.entries = dict()
+        self.current_ids = set()
+
+    def update(self, mobjects):
+        """
+        Brings the index up to date with mobjects, which are then
+        what queries are answered from.  Mobjects indexed before
+        but missing from mobjects are only dropped once there are
+        a good many of them.
+        """
+        entries = self.entries
+        for mob in mobjects:
+            entry = entries.get(id(mob))
+            if entry is None or entry[0] is not mob or \
+                    entry[1] != mob.points_version:
+                self.index_mobject(mob)
+        if len(entries) > 2 * len(mobjects) + 64:
+            current_ids = set(map(id, mobjects))
+            for key in list(entries.keys()):
+                if key not in current_ids:
+                    self.remove_key(key)
+        self.current_ids = set(map(id, mobjects))
+        return self
+
+    def index_mobject(self, mob):
+        key = id(mob)
+        points = mob.get_display_points()
+        if len(points) == 0:
+            self.remove_key(key)
+            return
+        box = (
+            *np.min(points[:, :2], axis=0),
+            *np.max(points[:, :2], axis=0),
+        )
+        self.tree.insert(key, box)
+        self.entries[key] = (mob, mob.points_version)
+
+    def remove_key(self, key):
+        self.entries.pop(key, None)
+        if key in self.tree:
+            self.tree.remove(key)
+
+    def query_region(self, box):
+        """
+        Returns the ids of the mobjects, among those last passed to
+        update, whose boxes meet box, given as (x_min, y_min, x_max,
+        y_max)
+        """
+        return set(self.tree.query(box)).intersection(self.current_ids)
+
+    def nearest_mobject(self, point):
+        """
+        Returns the mobject, among those last passed to update,
+        whose box is nearest to point, or None if there are none
+        """
+        key = self.tree.nearest(point, self.current_ids.__contains__)
+        if key is None:
+            return None
+        return self.entries[key][0]
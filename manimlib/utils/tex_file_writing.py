@@ -1,10 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
 import os
 import hashlib
+import re
+import shutil
+import tempfile
+import threading
 
 from manimlib.constants import TEX_DIR
 from manimlib.constants import TEX_TEXT_TO_REPLACE
 
 
+# Compilation jobs run latex and dvisvgm as subprocesses, so threads
+# are enough to keep several of them going at once
+TEX_COMPILATION_WORKERS = os.cpu_count() or 1
+# Each run of latex has a fixed cost of its own, so expressions are
+# only spread over more batches once there are this many per batch
+MIN_EXPRESSIONS_PER_BATCH = 16
+
+compilation_pool = None
+# Maps svg file paths to the futures of jobs which will write them
+pending_compilations = dict()
+pending_compilations_lock = threading.RLock()
+
+
+def reset_compilation_pool():
+    # The pool's threads do not survive a fork, so a forked
+    # process must not wait on anything they were doing
+    global compilation_pool
+    compilation_pool = None
+    pending_compilations.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_compilation_pool)
+
+
+def get_compilation_pool():
+    global compilation_pool
+    if compilation_pool is None:
+        compilation_pool = ThreadPoolExecutor(
+            max_workers=TEX_COMPILATION_WORKERS
+        )
+    return compilation_pool
+
+
 def tex_hash(expression, template_tex_file_body):
     id_str = str(expression + template_tex_file_body)
     hasher = hashlib.sha256()
@@ -13,12 +52,165 @@ def tex_hash(expression, template_tex_file_body):
     return hasher.hexdigest()[:16]
 
 
+def get_svg_file_path(expression, template_tex_file_body):
+    return os.path.join(
+        TEX_DIR,
+        tex_hash(expression, template_tex_file_body)
+    ) + ".svg"
+
+
 def tex_to_svg_file(expression, template_tex_file_body):
+    svg_file = get_svg_file_path(expression, template_tex_file_body)
+    future = pending_compilations.get(svg_file)
+    if future is not None:
+        # Should that job fail, the expression is compiled
+        # again below so that its own error is raised
+        future.exception()
+    if os.path.exists(svg_file):
+        # Possibly written by tex_to_svg_files, without
+        # a tex or dvi file of its own
+        return svg_file
+    return compile_tex(expression, template_tex_file_body)
+
+
+def tex_to_svg_files(expressions, template_tex_file_body):
+    """
+    Returns the svg files for all of the given expressions.  Those
+    which have not yet been compiled are split into batches, one per
+    worker of the compilation pool at most, and each batch becomes
+    the pages of a single document, so that latex and dvisvgm only
+    need to run once per batch.
+    """
+    futures = compile_tex_in_background(expressions, template_tex_file_body)
+    for future in futures:
+        future.exception()
+    return [
+        tex_to_svg_file(expression, template_tex_file_body)
+        for expression in expressions
+    ]
+
+
+def compile_tex_in_background(expressions, template_tex_file_body):
+    """
+    Submits whichever of the given expressions have no svg file
+    yet to the compilation pool, unless they are already being
+    compiled, and returns the futures of every job involved
+    """
+    futures = []
+    pending = []
+    with pending_compilations_lock:
+        for expression in expressions:
+            svg_file = get_svg_file_path(expression, template_tex_file_body)
+            if svg_file in pending_compilations:
+                futures.append(pending_compilations[svg_file])
+            elif not os.path.exists(svg_file) and expression not in pending:
+                pending.append(expression)
+        n_batches = min(
+            TEX_COMPILATION_WORKERS,
+            -(-len(pending) // MIN_EXPRESSIONS_PER_BATCH),
+        )
+        for i in range(n_batches):
+            batch = pending[i::n_batches]
+            future = get_compilation_pool().submit(
+                compile_tex_batch, batch, template_tex_file_body
+            )
+            for expression in batch:
+                svg_file = get_svg_file_path(expression, template_tex_file_body)
+                pending_compilations[svg_file] = future
+            future.add_done_callback(
+                lambda future, batch=batch: forget_compilations(
+                    batch, template_tex_file_body
+                )
+            )
+            futures.append(future)
+    return futures
+
+
+def forget_compilations(expressions, template_tex_file_body):
+    with pending_compilations_lock:
+        for expression in expressions:
+            pending_compilations.pop(
+                get_svg_file_path(expression, template_tex_file_body),
+                None
+            )
+
+
+def compile_tex_batch(expressions, template_tex_file_body):
+    if len(expressions) > 1:
+        try:
+            batch_tex_to_svg_files(expressions, template_tex_file_body)
+            return
+        except Exception as e:
+            # Fall back on compiling each expression on its own
+            print(
+                "Compiling {} expressions one by one, ".format(len(expressions)) +
+                "as compiling them together failed: {}".format(e)
+            )
+    # An error in one expression should not keep the others
+    # from being compiled, but it is still raised at the end
+    error = None
+    for expression in expressions:
+        try:
+            compile_tex(expression, template_tex_file_body)
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+
+
+def compile_tex(expression, template_tex_file_body):
     tex_file = generate_tex_file(expression, template_tex_file_body)
     dvi_file = tex_to_dvi(tex_file)
     return dvi_to_svg(dvi_file)
 
 
+def batch_tex_to_svg_files(expressions, template_tex_file_body):
+    tex_file = generate_batch_tex_file(expressions, template_tex_file_body)
+    dvi_file = tex_to_dvi(tex_file)
+    output_directory = tempfile.mkdtemp(dir=TEX_DIR)
+    try:
+        page_files = dvi_to_svg_pages(
+            dvi_file, len(expressions), output_directory
+        )
+        for expression, page_file in zip(expressions, page_files):
+            os.replace(
+                page_file,
+                get_svg_file_path(expression, template_tex_file_body)
+            )
+    finally:
+        shutil.rmtree(output_directory, ignore_errors=True)
+
+
+def generate_batch_tex_file(expressions, template_tex_file_body):
+    # Each expression is placed in its own standalone environment,
+    # which the multi option of the standalone class turns into a
+    # separate, tightly cropped page
+    document_class = re.compile(r"\\documentclass\[([^\]]*)\]\{standalone\}")
+    if not document_class.search(template_tex_file_body):
+        raise Exception("Only standalone templates can be compiled in batches")
+    preamble, body = template_tex_file_body.split("\\begin{document}")
+    body, closing = body.split("\\end{document}")
+    preamble = document_class.sub(
+        lambda match: "\\documentclass[{},multi]{{standalone}}".format(match.group(1)),
+        preamble
+    )
+    pages = "".join([
+        "\\begin{standalone}\n"
+        + body.replace(TEX_TEXT_TO_REPLACE, expression)
+        + "\n\\end{standalone}\n"
+        for expression in expressions
+    ])
+    result = os.path.join(
+        TEX_DIR,
+        "batch_" + tex_hash("\n".join(expressions), template_tex_file_body)
+    ) + ".tex"
+    if not os.path.exists(result):
+        print("Writing {} expressions to {}".format(len(expressions), result))
+        new_body = preamble + "\\begin{document}\n" + pages + "\\end{document}" + closing
+        write_file_atomically(result, new_body)
+    return result
+
+
 def generate_tex_file(expression, template_tex_file_body):
     result = os.path.join(
         TEX_DIR,
@@ -31,29 +223,50 @@ def generate_tex_file(expression, template_tex_file_body):
         new_body = template_tex_file_body.replace(
             TEX_TEXT_TO_REPLACE, expression
         )
-        with open(result, "w", encoding="utf-8") as outfile:
-            outfile.write(new_body)
+        write_file_atomically(result, new_body)
     return result
 
 
+def write_file_atomically(file_path, text):
+    # Other renders sharing TEX_DIR only ever see
+    # the file once it is complete
+    fd, temp_file_path = tempfile.mkstemp(dir=TEX_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as outfile:
+        outfile.write(text)
+    os.replace(temp_file_path, file_path)
+
+
 def tex_to_dvi(tex_file):
     result = tex_file.replace(".tex", ".dvi")
     if not os.path.exists(result):
-        commands = [
-            "latex",
-            "-interaction=batchmode",
-            "-halt-on-error",
-            "-output-directory=" + TEX_DIR,
-            tex_file,
-            ">",
-            os.devnull
-        ]
-        exit_code = os.system(" ".join(commands))
-        if exit_code != 0:
-            log_file = tex_file.replace(".tex", ".log")
-            raise Exception(
-                ("Latex error converting to dvi. " +
-                "See log output above or the log file: %s" % log_file))
+        # latex writes into a private directory, from which the
+        # finished dvi is renamed into place
+        output_directory = tempfile.mkdtemp(dir=TEX_DIR)
+        try:
+            commands = [
+                "latex",
+                "-interaction=batchmode",
+                "-halt-on-error",
+                "-output-directory=" + output_directory,
+                tex_file,
+                ">",
+                os.devnull
+            ]
+            exit_code = os.system(" ".join(commands))
+            temp_result = os.path.join(
+                output_directory, os.path.basename(result)
+            )
+            if exit_code != 0:
+                log_file = tex_file.replace(".tex", ".log")
+                temp_log_file = temp_result.replace(".dvi", ".log")
+                if os.path.exists(temp_log_file):
+                    os.replace(temp_log_file, log_file)
+                raise Exception(
+                    ("Latex error converting to dvi. " +
+                    "See log output above or the log file: %s" % log_file))
+            os.replace(temp_result, result)
+        finally:
+            shutil.rmtree(output_directory, ignore_errors=True)
     return result
 
 
@@ -66,16 +279,69 @@ def dvi_to_svg(dvi_file):
     """
     result = dvi_file.replace(".dvi", ".svg")
     if not os.path.exists(result):
-        commands = [
-            "dvisvgm",
-            dvi_file,
-            "-n",
-            "-v",
-            "0",
-            "-o",
-            result,
-            ">",
-            os.devnull
-        ]
-        os.system(" ".join(commands))
+        output_directory = tempfile.mkdtemp(dir=TEX_DIR)
+        try:
+            temp_result = os.path.join(
+                output_directory, os.path.basename(result)
+            )
+            run_dvisvgm(
+                dvi_file, ["-n", "-o", temp_result], output_directory
+            )
+            os.replace(temp_result, result)
+        finally:
+            shutil.rmtree(output_directory, ignore_errors=True)
     return result
+
+
+def dvi_to_svg_pages(dvi_file, n_pages, output_directory):
+    """
+    Converts every page of a dvi into its own svg within
+    output_directory, returning the paths of these files
+    in page order
+    """
+    # Page numbers are padded with zeros to a width given explicitly,
+    # rather than to whatever width dvisvgm would choose for %p
+    width = len(str(n_pages))
+    page_field = "%{}p".format(width)
+    result_pattern = os.path.join(
+        output_directory,
+        os.path.basename(dvi_file).replace(".dvi", "-" + page_field + ".svg")
+    )
+    run_dvisvgm(
+        dvi_file, ["-p", "1-", "-n", "-o", result_pattern], output_directory
+    )
+    results = [
+        result_pattern.replace(page_field, str(page).zfill(width))
+        for page in range(1, n_pages + 1)
+    ]
+    missing = [result for result in results if not os.path.exists(result)]
+    if missing:
+        raise Exception("dvisvgm did not write {} of {} pages, e.g. {}".format(
+            len(missing), n_pages, os.path.basename(missing[0])
+        ))
+    return results
+
+
+def run_dvisvgm(dvi_file, arguments, output_directory):
+    # Errors are written to a log in output_directory, which is
+    # kept next to the dvi file should dvisvgm fail
+    temp_log_file = os.path.join(output_directory, "dvisvgm.log")
+    commands = [
+        "dvisvgm",
+        dvi_file,
+        *arguments,
+        "-v",
+        "1",
+        ">",
+        temp_log_file,
+        "2>&1",
+    ]
+    exit_code = os.system(" ".join(commands))
+    if exit_code != 0:
+        log_file = dvi_file.replace(".dvi", ".dvisvgm.log")
+        if os.path.exists(temp_log_file):
+            os.replace(temp_log_file, log_file)
+        raise Exception(
+            "dvisvgm error converting to svg. " +
+            "See the log file: %s" % log_file
+        )